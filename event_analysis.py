@@ -0,0 +1,236 @@
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+# Dictionary of important dates for 2024, parsed once at import
+IMPORTANT_DATES = {name: pd.Timestamp(date) for name, date in {
+    "New Year": "2024-01-01",
+    "Pongal": "2024-01-14",
+    "Republic Day": "2024-01-26",
+    "Good Friday": "2024-03-29",
+    "Eid al-Fitr": "2024-04-10",
+    "Tamil New Year": "2024-04-14",
+    "Eid al-Adha": "2024-06-16",
+    "Independence Day": "2024-08-15",
+    "Diwali": "2024-11-01",
+    "Christmas": "2024-12-25",
+    "Exam Start": "2024-03-01",
+    "Exam End": "2024-04-15",
+    "Wedding Peak 1": "2024-02-15",
+    "Wedding Peak 2": "2024-11-25"
+}.items()}
+
+# Days either side of an event that are analysed
+EVENT_WINDOW = pd.Timedelta(days=7)
+
+SALES_DATE = 'Sale Date'
+SALES_VALUE = 'Sales Collected (Exc.Tax)'
+LEAVES_DATE = 'Date'
+LEAVES_VALUE = 'MTD Sale'
+
+# Rows of a raw table sent to the browser in a preview
+PREVIEW_ROWS = 500
+
+
+# Uploads hold business data, so they are cached in memory only and expire
+@st.cache_data(ttl=3600, max_entries=8)
+def load_event_data(file, date_column=None, numeric_columns=None):
+    """
+    Load an uploaded CSV, dropping rows with an invalid date or numeric value
+    """
+    try:
+        # Keep the parsed columns Arrow-backed so text columns are stored as
+        # contiguous Arrow strings rather than Python objects
+        data = pd.read_csv(file, engine='pyarrow', dtype_backend='pyarrow')
+        # Convert date column to datetime, as a NumPy column so invalid
+        # dates are NaT for dropna below
+        if date_column:
+            data[date_column] = pd.to_datetime(
+                data[date_column], errors='coerce', dayfirst=True).astype('datetime64[ns]')
+        # Convert specified numeric columns to NumPy floats. An Arrow double
+        # column keeps coerced values as NaN rather than null, and dropna
+        # would leave those rows in
+        if numeric_columns:
+            for col in numeric_columns:
+                data[col] = pd.to_numeric(data[col], errors='coerce').astype('float64')
+        # Drop rows with invalid date or numeric values
+        if date_column:
+            data = data.dropna(subset=[date_column])
+        if numeric_columns:
+            data = data.dropna(subset=numeric_columns)
+        # Store centers as a categorical so center filters compare codes
+        if 'Center Name' in data.columns:
+            data['Center Name'] = data['Center Name'].astype('category')
+        return data
+    except Exception as e:
+        st.error(f"Error loading data: {e}")
+        return None
+
+
+@st.cache_data
+def sort_by_date(data, date_column):
+    """
+    Rows in date order, so event windows can be found by binary search
+    """
+    return data.sort_values(date_column, kind='stable').reset_index(drop=True)
+
+
+@st.cache_data
+def filter_year(data, date_column, year):
+    """
+    Rows whose date falls in the given calendar year, in date order
+    """
+    return sort_by_date(data[data[date_column].dt.year == year], date_column)
+
+
+def event_window(data, date_column, event_date):
+    """
+    Rows of date-sorted data within EVENT_WINDOW either side of an event
+    """
+    dates = data[date_column].to_numpy(dtype='datetime64[ns]')
+    start = np.searchsorted(dates, (event_date - EVENT_WINDOW).to_datetime64(), 'left')
+    end = np.searchsorted(dates, (event_date + EVENT_WINDOW).to_datetime64(), 'right')
+    return data.iloc[start:end]
+
+
+def daily_totals(data, date_column, value_column):
+    """
+    Sum of one value column per date
+    """
+    # Few distinct dates fall in an event window, so a bincount over the
+    # date positions is cheaper than a hash groupby
+    dates, positions = np.unique(data[date_column].to_numpy(dtype='datetime64[ns]'),
+                                 return_inverse=True)
+    totals = np.bincount(positions, weights=data[value_column].to_numpy(dtype=float),
+                         minlength=len(dates))
+    return pd.DataFrame({date_column: dates, value_column: totals})
+
+
+def show_preview(data):
+    """
+    Show the first PREVIEW_ROWS rows of a table, noting how many were left out
+    """
+    st.dataframe(data.head(PREVIEW_ROWS))
+    if len(data) > PREVIEW_ROWS:
+        st.caption(f"Showing the first {PREVIEW_ROWS:,} of {len(data):,} rows.")
+
+
+def render_event_analysis(sales_data, leaves_data=None):
+    """
+    Event and center selection, the sales around the chosen event and, when
+    leaves data is given, the leave sales around it
+    """
+    # Filter sales data for 2024
+    filtered_sales = filter_year(sales_data, SALES_DATE, 2024)
+
+    # Dropdowns for event and center selection
+    st.subheader("Event Selection")
+    selected_event = st.selectbox("Choose an event:", list(IMPORTANT_DATES.keys()))
+    event_date = IMPORTANT_DATES[selected_event]
+
+    selected_center = st.selectbox("Choose a Center:",
+                                   filtered_sales['Center Name'].cat.remove_unused_categories().cat.categories.tolist() if 'Center Name' in filtered_sales.columns else ["All Centers"])
+
+    # Filter sales data for the selected event (±7 days)
+    event_sales = event_window(filtered_sales, SALES_DATE, event_date)
+    if selected_center != "All Centers":
+        centers = event_sales['Center Name'].cat
+        center_code = centers.categories.get_indexer([selected_center])[0]
+        event_sales = event_sales[(centers.codes.to_numpy() == center_code) & (center_code >= 0)]
+
+    # Filter leaves data for the selected event
+    event_leaves = event_window(sort_by_date(leaves_data, LEAVES_DATE), LEAVES_DATE, event_date) \
+        if leaves_data is not None else pd.DataFrame()
+
+    if event_sales.empty and event_leaves.empty:
+        st.warning(f"No sales data found for {selected_event} (±7 days).")
+        return
+
+    # Display filtered data
+    st.subheader(f"Filtered Data for {selected_event} (±7 Days from {event_date.strftime('%Y-%m-%d')})")
+
+    if not event_sales.empty:
+        st.write("Sales Data:")
+        show_preview(event_sales)
+
+        # Plot MTD Sales Histogram for Sales Data
+        sales_mtd = daily_totals(event_sales, SALES_DATE, SALES_VALUE)
+        fig_sales = px.bar(
+            sales_mtd, x=SALES_DATE, y=SALES_VALUE,
+            color=SALES_VALUE, color_continuous_scale="blues",
+            title=f"Sales MTD Histogram Around {selected_event}"
+        )
+        fig_sales.update_layout(
+            xaxis_title="Date", yaxis_title="MTD Sales (Exc. Tax)", bargap=0.2
+        )
+        st.plotly_chart(fig_sales)
+
+        # Total Sales Analysis
+        total_sales = event_sales[SALES_VALUE].sum()
+        st.subheader("Total Sales Analysis")
+        st.write(f"Total Sales for {selected_center} during {selected_event}: {total_sales:.2f}")
+    else:
+        st.warning(f"No sales data found for {selected_event} (±7 days).")
+
+    if leaves_data is None:
+        return
+
+    if not event_leaves.empty:
+        st.write("Leaves Data:")
+        show_preview(event_leaves)
+
+        # Plot MTD Sales Histogram for Leaves Data
+        leaves_mtd = daily_totals(event_leaves, LEAVES_DATE, LEAVES_VALUE)
+        fig_leaves = px.bar(
+            leaves_mtd, x=LEAVES_DATE, y=LEAVES_VALUE,
+            color=LEAVES_VALUE, color_continuous_scale="greens",
+            title=f"Leave MTD Histogram Around {selected_event}"
+        )
+        fig_leaves.update_layout(
+            xaxis_title="Date", yaxis_title="MTD Sales (Leave Data)", bargap=0.2
+        )
+        st.plotly_chart(fig_leaves)
+
+        # Total Leave Sales Analysis
+        total_leaves_sales = event_leaves[LEAVES_VALUE].sum()
+        st.subheader("Total Leave Sales Analysis")
+        st.write(f"Total Leave Sales during {selected_event}: {total_leaves_sales:.2f}")
+    else:
+        st.warning(f"No leave data found for {selected_event} (±7 days).")
+
+
+def upload_event_files(container):
+    """
+    Sales and leaves CSV uploaders placed in the given container
+    """
+    sales_file = container.file_uploader("Upload Service Sales CSV", type=["csv"])
+    leaves_file = container.file_uploader("Upload Leaves Data CSV", type=["csv"])
+    return sales_file, leaves_file
+
+
+def render_uploaded_event_analysis(sales_file, leaves_file):
+    """
+    Load the uploaded sales and leaves files, preview them and analyse the
+    events once both are valid
+    """
+    # Load sales and leaves datasets
+    sales_data = load_event_data(sales_file, date_column=SALES_DATE, numeric_columns=[SALES_VALUE]) if sales_file else None
+    leaves_data = load_event_data(leaves_file, date_column=LEAVES_DATE, numeric_columns=[LEAVES_VALUE]) if leaves_file else None
+
+    # Check if data is loaded
+    if sales_data is None or sales_data.empty:
+        st.warning("Please upload a valid Service Sales dataset.")
+    else:
+        st.write("Sales Data Preview:")
+        show_preview(sales_data)
+
+    if leaves_data is None or leaves_data.empty:
+        st.warning("Please upload a valid Leaves dataset.")
+    else:
+        st.write("Leaves Data Preview:")
+        show_preview(leaves_data)
+
+    # Proceed only if both datasets are loaded
+    if sales_data is not None and not sales_data.empty and leaves_data is not None and not leaves_data.empty:
+        render_event_analysis(sales_data, leaves_data)
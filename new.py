@@ -5,8 +5,11 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 import os
+import glob
+import pyarrow.csv as pv
 from process_data import preprocess_sales_data, load_processed_service_data
 from utils.s3_utils import read_csv_from_s3, check_file_exists_in_s3
+from event_analysis import render_uploaded_event_analysis, upload_event_files
 
 def format_indian_money(amount, format_type='full'):
     """
@@ -19,31 +22,171 @@ def format_indian_money(amount, format_type='full'):
         """Helper function to add commas in Indian number system"""
         s = str(int(round(num)))
         if len(s) > 3:
-            last3 = s[-3:]
-            rest = s[:-3]
-            formatted_rest = ''
-            for i in range(len(rest)-1, -1, -2):
-                if i == 0:
-                    formatted_rest = rest[i] + formatted_rest
-                else:
-                    formatted_rest = ',' + \
-                        rest[max(i-1, 0):i+1] + formatted_rest
-            result = formatted_rest + ',' + last3 if formatted_rest else last3
-            # Remove the leftmost comma if it exists
-            if result.startswith(','):
-                result = result[1:]
-            return result
+            rest, last3 = s[:-3], s[-3:]
+            # Split the rest into 2-digit groups from the right and join once
+            head = len(rest) % 2
+            groups = [rest[:head]] if head else []
+            groups += [rest[i:i + 2] for i in range(head, len(rest), 2)]
+            return ','.join(groups + [last3])
         return s
 
-    # Format with Indian style commas
-    formatted_amount = format_with_indian_commas(amount)
-    return f"₹{formatted_amount}"
+    # Format with Indian style commas, keeping the sign outside the digits
+    formatted_amount = format_with_indian_commas(abs(amount))
+    sign = '-' if round(amount) < 0 else ''
+    return f"{sign}₹{formatted_amount}"
+
+
+# Zero-padded digit groups used by the vectorized formatter
+_TWO_DIGIT_GROUPS = np.array([f"{i:02d}" for i in range(100)])
+_THREE_DIGIT_GROUPS = np.array([f"{i:03d}" for i in range(1000)])
+
+# Largest magnitude the vectorized formatter casts to int64
+_MAX_FORMATTED_AMOUNT = 9e18
+
+
+def format_indian_money_array(values, symbol="₹"):
+    """
+    Vectorized format_indian_money for a whole array of amounts
+    """
+    values = np.asarray(values, dtype=float)
+    flat = values.ravel()
+
+    # Missing, infinite and out-of-range values are shown as zero, since
+    # they have no digits to group and would overflow the integer cast
+    representable = np.abs(flat) < _MAX_FORMATTED_AMOUNT
+    amounts = np.rint(np.where(representable, flat, 0)).astype(np.int64)
+    negative = amounts < 0
+    amounts = np.abs(amounts)
+
+    last3 = amounts % 1000
+    rest = amounts // 1000
+    result = np.where(rest > 0, _THREE_DIGIT_GROUPS[last3], last3.astype(str))
+
+    # Prepend the remaining digits in groups of two, one group per pass
+    while (rest > 0).any():
+        group = np.where(rest >= 100, _TWO_DIGIT_GROUPS[rest % 100],
+                         (rest % 100).astype(str))
+        result = np.where(rest > 0, np.char.add(
+            np.char.add(group, ','), result), result)
+        rest = rest // 100
+
+    result = np.char.add(np.where(negative, '-' + symbol, symbol), result)
+    return result.astype(object).reshape(values.shape)
+
+
+def format_positive_money_array(values, symbol="₹"):
+    """
+    format_indian_money_array for amounts above zero, blank for zero,
+    negative and missing values
+    """
+    values = np.asarray(values, dtype=float)
+    result = np.full(values.shape, "", dtype=object)
+    positive = values > 0
+    result[positive] = format_indian_money_array(values[positive], symbol)
+    return result
+
+
+def format_percent_array(values, missing=None):
+    """
+    Vectorized f"{x:.2f}%" for an array of percentages, optionally showing
+    missing for NaN and infinite values
+    """
+    values = np.asarray(values, dtype=float)
+    result = np.char.add(np.char.mod('%.2f', values), '%').astype(object)
+    if missing is not None:
+        result[~np.isfinite(values)] = missing
+    return result
+
+
+def growth_percent(current, previous):
+    """
+    Percentage growth of current over previous, 0 where previous has no
+    positive sales
+    """
+    current = np.asarray(current, dtype=float)
+    previous = np.asarray(previous, dtype=float)
+    has_previous = previous > 0
+    return np.where(has_previous,
+                    (current / np.where(has_previous, previous, 1) - 1) * 100, 0.0)
 
 
 # S3 configuration
 S3_BUCKET = st.secrets["S3_BUCKET"]
 S3_PREFIX = st.secrets["S3_PREFIX"]
 
+
+@st.cache_data(ttl=300)
+def s3_file_exists(key):
+    """
+    Cached existence check so reloads within five minutes skip the HEAD request
+    """
+    return check_file_exists_in_s3(S3_BUCKET, key)
+
+
+def read_local_csv(file_path, skip_rows=0):
+    """
+    Parse a local CSV with pyarrow's multithreaded reader, with empty cells
+    as nulls and stripped column names
+    """
+    table = pv.read_csv(
+        file_path,
+        read_options=pv.ReadOptions(skip_rows=skip_rows),
+        convert_options=pv.ConvertOptions(strings_can_be_null=True))
+    df = table.to_pandas()
+    df.columns = df.columns.str.strip()
+    return df
+
+
+# Version of the cleaning applied before a local Parquet copy is written.
+# Bump it whenever the parsing or cleanup changes so copies written by an
+# earlier build are ignored instead of served until the CSV changes.
+LOCAL_PARQUET_VERSION = 2
+
+
+def local_parquet_path(file_path, suffix):
+    """
+    Path of the cleaned Parquet copy stored next to a local CSV
+    """
+    return f"{os.path.splitext(file_path)[0]}.v{LOCAL_PARQUET_VERSION}{suffix}"
+
+
+def read_local_parquet(file_path, suffix):
+    """
+    Read the cleaned Parquet copy of a local CSV, returning None if it is
+    missing, unreadable or older than the CSV
+    """
+    pq_path = local_parquet_path(file_path, suffix)
+    if (os.path.exists(pq_path)
+            and os.path.getmtime(pq_path) >= os.path.getmtime(file_path)):
+        try:
+            return pd.read_parquet(pq_path, engine="pyarrow")
+        except Exception:
+            return None
+    return None
+
+
+def write_local_parquet(df, file_path, suffix):
+    """
+    Store a cleaned Parquet copy next to a local CSV so later loads skip
+    parsing and cleanup
+    """
+    pq_path = local_parquet_path(file_path, suffix)
+    try:
+        df.to_parquet(pq_path, engine="pyarrow", compression="zstd", index=False)
+    except Exception as e:
+        st.warning(f"Could not save {file_path} as Parquet: {e}")
+        return
+
+    # Remove copies left by earlier cleaning versions, unversioned ones included
+    base = glob.escape(os.path.splitext(file_path)[0])
+    for old_path in glob.glob(f"{base}.v*{suffix}") + glob.glob(f"{base}{suffix}"):
+        if old_path != pq_path:
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+
+
 # Set page configuration
 st.set_page_config(
     page_title="Salon Business Dashboard",
@@ -58,24 +201,379 @@ st.markdown("### Sales and Service Performance Analytics")
 # Load data
 
 
+# Sales columns read by the dashboard
+SALES_COLUMNS = ['SALON NAMES', 'BRAND', 'Year', 'Month',
+                 'MTD SALES', 'MTD BILLS', 'DAY SALES']
+
+# Low-cardinality text columns stored as categoricals
+CATEGORY_COLUMNS = ['BRAND', 'SALON NAMES', 'Center Name', 'Year', 'Service_Type',
+                    'Business Unit', 'Item Category', 'Item Subcategory', 'Category']
+
+
+def to_categorical(df, columns=CATEGORY_COLUMNS):
+    """
+    Convert the given text columns to categoricals where present
+    """
+    for col in columns:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+
+def downcast_numeric(df):
+    """
+    Store sales amounts as float32 and counts in the smallest integer dtype
+    that holds them
+    """
+    for col in ['MTD SALES', 'MTD BILLS', 'Total_Sales']:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('float32')
+    for col in ['Transaction_Count', 'Total_Quantity']:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+
+def column_mask(column, value):
+    """
+    Boolean mask of rows equal to value, comparing codes for categoricals
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        categories = column.cat.categories
+        if value not in categories:
+            return np.zeros(len(column), dtype=bool)
+        return column.cat.codes.to_numpy() == categories.get_loc(value)
+    return (column == value).to_numpy()
+
+
+def build_mask(df, conditions):
+    """
+    Combine (column, value) equality filters into one boolean mask,
+    skipping "All" selections and columns the frame does not have
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for col, value in conditions:
+        if value != "All" and col in df.columns:
+            mask &= column_mask(df[col], value)
+    return mask
+
+
 @st.cache_data
 def load_data():
-    # Check if processed data exists in S3, if not process the raw data
-    if check_file_exists_in_s3(S3_BUCKET, f"{S3_PREFIX}processed_sales_data.csv"):
+    # Read the processed CSV from S3, processing the raw data only if it is
+    # not there yet
+    if s3_file_exists(f"{S3_PREFIX}processed_sales_data.csv"):
         sales_data = read_csv_from_s3(
             S3_BUCKET, f"{S3_PREFIX}processed_sales_data.csv")
     else:
         sales_data = preprocess_sales_data()
 
+    # Keep only the columns the dashboard reads
+    sales_data = sales_data[[
+        col for col in SALES_COLUMNS if col in sales_data.columns]]
+
     # Load processed service data
     service_data = load_processed_service_data()
 
+    sales_data = downcast_numeric(to_categorical(sales_data))
+    service_data = downcast_numeric(to_categorical(service_data))
+
     return sales_data, service_data
 
 
+@st.cache_data
+def load_category_data():
+    category_file_key = f"{S3_PREFIX}outputs/Hair___skin__spa_and_products___For_each_20250326_222907.csv"
+    category_data = None
+    if s3_file_exists(category_file_key):
+        category_data = read_csv_from_s3(S3_BUCKET, category_file_key)
+
+    return category_data
+
+
+# Rows shown in the category by business unit table before "Show all"
+TOP_CATEGORY_ROWS = 50
+
+# Calendar order of months and the abbreviations used in the raw data
+MONTH_ORDER = ['January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December']
+MONTH_MAPPING = {month[:3]: month for month in MONTH_ORDER}
+
+# Filter columns and measures of the pre-aggregated cubes
+SALES_CUBE_KEYS = ['SALON NAMES', 'BRAND', 'Year', 'Month']
+SALES_CUBE_VALUES = ['MTD SALES', 'MTD BILLS']
+SERVICE_CUBE_KEYS = ['Center Name', 'Year', 'Service_Type', 'Category',
+                     'Business Unit', 'Item Category', 'Item Subcategory']
+SERVICE_CUBE_VALUES = ['Total_Sales', 'Transaction_Count']
+
+
+def widen_float32(df, columns):
+    """
+    The given columns with float32 amounts widened to float64, so sums of
+    many rows stay exact to the rupee
+    """
+    return df[columns].astype({col: 'float64' for col in columns
+                               if df[col].dtype == np.float32})
+
+
+def build_cube(df, keys, values):
+    """
+    Sum the measures over every combination of the filter columns
+    """
+    keys = [key for key in keys if key in df.columns]
+    # Group order is irrelevant here since every consumer regroups or sorts
+    return widen_float32(df, keys + values).groupby(
+        keys, observed=True, dropna=False, sort=False)[values].sum().reset_index()
+
+
+def sum_by(df, keys, value):
+    """
+    Sum one measure over the given columns as a flat frame
+    """
+    keys = [keys] if isinstance(keys, str) else keys
+    return widen_float32(df, keys + [value]).groupby(
+        keys, observed=True)[value].sum().reset_index()
+
+
+def year_pair(df, key, first_year, second_year, suffixes):
+    """
+    MTD sales of two years side by side for the keys present in both years
+    """
+    wide = df.pivot(index=key, columns='Year', values='MTD SALES')[
+        [first_year, second_year]].dropna()
+    wide.columns = [f'MTD SALES{suffix}' for suffix in suffixes]
+    return wide.reset_index()
+
+
+def build_daily_cube(sales_data):
+    """
+    Average MTD sales per outlet, year, month and day for the daily chart
+    """
+    day_sales = sales_data['DAY SALES']
+    has_day = day_sales.notna() & (day_sales != '') & (day_sales != 0)
+    return sales_data[has_day].groupby(
+        ['SALON NAMES', 'Year', 'Month', 'DAY SALES'], observed=True
+    )['MTD SALES'].mean().reset_index()
+
+
+def outlet_sales(sales_data, outlet):
+    """
+    Rows of one outlet and its total sales per year
+    """
+    rows = sales_data[column_mask(sales_data['SALON NAMES'], outlet)]
+    return rows, sum_by(rows, 'Year', 'MTD SALES')
+
+
+def category_options(df, col):
+    """
+    Sorted distinct values of a categorical column, empty if it is missing
+    """
+    if col not in df.columns:
+        return []
+    return df[col].cat.remove_unused_categories().cat.categories.tolist()
+
+
+@st.cache_resource
+def get_prepared_state():
+    """
+    Load the data once and precompute values shared by every rerun
+    """
+    sales_data, service_data = load_data()
+
+    # Expand abbreviated month names and keep months in calendar order
+    sales_data['Month'] = sales_data['Month'].map(MONTH_MAPPING).fillna(
+        sales_data['Month']).astype(pd.CategoricalDtype(MONTH_ORDER, ordered=True))
+
+    sales_cube = build_cube(sales_data, SALES_CUBE_KEYS, SALES_CUBE_VALUES)
+    service_cube = build_cube(service_data, SERVICE_CUBE_KEYS, SERVICE_CUBE_VALUES) \
+        if not service_data.empty else service_data
+
+    return {
+        'sales': sales_data,
+        'service': service_data,
+        'sales_cube': sales_cube,
+        'outlet_monthly_cube': sales_cube.groupby(
+            ['SALON NAMES', 'Year', 'Month'], observed=True)['MTD SALES'].sum().reset_index(),
+        'daily_cube': build_daily_cube(sales_data)
+        if 'DAY SALES' in sales_data.columns else None,
+        'salon_year_sales': sum_by(sales_cube, ['SALON NAMES', 'Year'], 'MTD SALES'),
+        'brand_year_sales': sum_by(sales_cube, ['BRAND', 'Year'], 'MTD SALES'),
+        'month_year_sales': sum_by(sales_cube, ['Month', 'Year'], 'MTD SALES'),
+        'year_sales': sales_cube.groupby('Year', observed=True)['MTD SALES'].sum(),
+        'center_year_sales': sum_by(service_cube, ['Center Name', 'Year'], 'Total_Sales')
+        if not service_data.empty else service_data,
+        'service_cube': service_cube,
+        't_nagar': outlet_sales(sales_data, 'T NAGAR'),
+        'years': sorted(sales_data['Year'].unique()),
+        'brands': category_options(sales_data, 'BRAND'),
+        'months': sales_data['Month'].dropna().unique().sort_values().tolist(),
+        'outlets': category_options(sales_data, 'SALON NAMES'),
+        'service_years': sorted(service_data['Year'].unique())
+        if 'Year' in service_data.columns else [],
+        'centers': category_options(service_data, 'Center Name'),
+        'service_types': category_options(service_data, 'Service_Type'),
+        'item_categories': category_options(service_data, 'Item Category'),
+        'business_units': category_options(service_data, 'Business Unit'),
+        'item_subcategories': category_options(service_data, 'Item Subcategory')
+    }
+
+
+# Charts built from small aggregates are cached, so reruns that do not
+# change their inputs skip rebuilding the figures
+@st.cache_data
+def outlet_growth_chart(growth_data, title):
+    """
+    Growth percentage by outlet, colored from red to green
+    """
+    fig = px.bar(
+        growth_data,
+        x='SALON NAMES',
+        y='Growth_Percent',
+        title=title,
+        labels={'Growth_Percent': 'Growth (%)', 'SALON NAMES': 'Outlet'},
+        color='Growth_Percent',
+        color_continuous_scale='RdYlGn',
+        text='Growth_Percent'
+    )
+    fig.update_traces(
+        texttemplate='%{text:.2f}%', textposition='outside'
+    )
+    fig.update_traces(
+        hovertemplate='%{text}<extra></extra>'
+    )
+    return fig
+
+
+@st.cache_data
+def center_growth_chart(growth_df, growth_cols):
+    """
+    Grouped bars of each center's growth for every pair of years
+    """
+    # One bar trace per period, straight from the wide frame
+    fig = go.Figure()
+    center_names = growth_df['Center Name'].to_numpy()
+    for col in growth_cols:
+        fig.add_trace(go.Bar(
+            x=center_names,
+            y=growth_df[col].to_numpy(),
+            name=col,
+            texttemplate='%{y:,.1f}%',
+            textposition='outside',
+            hovertemplate='%{y:,.1f}%<extra></extra>'
+        ))
+    fig.update_layout(
+        barmode='group',
+        title="Year-over-Year Growth by Center (%)",
+        xaxis_title='Center',
+        yaxis_title='Growth %',
+        legend_title='Period'
+    )
+    return fig
+
+
+@st.cache_data
+def monthly_comparison_chart(monthly_growth, base_year, compare_year):
+    """
+    Monthly growth bars with both years' sales as lines on a second axis
+    """
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+
+    # Add bar chart for growth percentage
+    fig.add_trace(
+        go.Bar(
+            x=monthly_growth['Month'],
+            y=monthly_growth['Growth_Percent'],
+            name='Growth %',
+            marker_color='lightgreen',
+            hovertemplate='%{y:.2f}%<extra></extra>'
+        ),
+        secondary_y=False
+    )
+
+    # Add line charts for sales values
+    fig.add_trace(
+        go.Scatter(
+            x=monthly_growth['Month'],
+            y=monthly_growth['MTD SALES_base'],
+            name=f'Sales {base_year}',
+            mode='lines+markers',
+            line=dict(color='blue'),
+            hovertemplate='₹%{y:,.0f}<extra></extra>'
+        ),
+        secondary_y=True
+    )
+
+    fig.add_trace(
+        go.Scatter(
+            x=monthly_growth['Month'],
+            y=monthly_growth['MTD SALES_compare'],
+            name=f'Sales {compare_year}',
+            mode='lines+markers',
+            line=dict(color='red'),
+            hovertemplate='₹%{y:,.0f}<extra></extra>'
+        ),
+        secondary_y=True
+    )
+
+    fig.update_layout(
+        title=f"Monthly Sales Comparison: {base_year} vs {compare_year}",
+        hovermode="x unified"
+    )
+
+    fig.update_yaxes(
+        title_text="Growth (%)",
+        secondary_y=False
+    )
+    fig.update_yaxes(
+        title_text="Sales (in Lakhs)",
+        secondary_y=True
+    )
+    return fig
+
+
+@st.cache_data
+def brand_comparison_chart(brand_growth, base_year, compare_year):
+    """
+    Both years' sales per brand side by side, labelled with the growth
+    """
+    fig = go.Figure()
+    brand_names = brand_growth['BRAND'].to_numpy()
+    for year, col in [(base_year, 'MTD SALES_base'),
+                      (compare_year, 'MTD SALES_compare')]:
+        fig.add_trace(go.Bar(
+            x=brand_names,
+            y=brand_growth[col].to_numpy(),
+            name=str(year),
+            hovertemplate='₹%{y:,.0f}<extra></extra>'
+        ))
+    fig.update_layout(
+        barmode='group',
+        title=f"Brand Performance: {base_year} vs {compare_year}",
+        xaxis_title='Brand',
+        yaxis_title='Sales (₹)',
+        legend_title='Year'
+    )
+
+    # Add growth percentage as text above the taller bar of each brand
+    brand_peaks = np.maximum(brand_growth['MTD SALES_base'].to_numpy(),
+                             brand_growth['MTD SALES_compare'].to_numpy())
+    fig.update_layout(annotations=[
+        dict(x=brand, y=peak, text=f"{growth_pct:.1f}%",
+             showarrow=True, arrowhead=1)
+        for brand, peak, growth_pct in zip(
+            brand_names, brand_peaks, brand_growth['Growth_Percent'].to_numpy())
+    ])
+    return fig
+
+
 # Display data processing status
 with st.spinner("Loading data..."):
-    sales_data, service_data = load_data()
+    prepared_state = get_prepared_state()
+
+sales_data = prepared_state['sales']
+service_data = prepared_state['service']
+sales_cube = prepared_state['sales_cube']
+service_cube = prepared_state['service_cube']
 
 # Check if service data was successfully loaded
 has_service_data = not service_data.empty
@@ -91,38 +589,31 @@ with tab1:
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        years = sorted(sales_data['Year'].unique())
+        years = prepared_state['years']
         selected_year = st.selectbox("Select Year", years)
 
     with col2:
-        brands = sorted(sales_data['BRAND'].unique())
-        selected_brand = st.selectbox("Select Brand", ["All"] + list(brands))
+        brands = prepared_state['brands']
+        selected_brand = st.selectbox("Select Brand", ["All"] + brands)
 
     with col3:
-        months = sorted(sales_data['Month'].unique())
-        selected_month = st.selectbox("Select Month", ["All"] + list(months))
-
-    # Filter data based on selections
-    filtered_data = sales_data.copy()
-
-    if selected_year != "All":
-        filtered_data = filtered_data[filtered_data['Year'] == selected_year]
+        months = prepared_state['months']
+        selected_month = st.selectbox("Select Month", ["All"] + months)
 
-    if selected_brand != "All":
-        filtered_data = filtered_data[filtered_data['BRAND'] == selected_brand]
+    # Filter the sales cube based on selections with a single combined mask
+    mask = build_mask(sales_cube, [('Year', selected_year),
+                                   ('BRAND', selected_brand),
+                                   ('Month', selected_month)])
 
-    if selected_month != "All":
-        filtered_data = filtered_data[filtered_data['Month'] == selected_month]
-
-    # Display key metrics
+    # Display key metrics, reduced straight from the masked columns
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        total_sales = filtered_data['MTD SALES'].sum()
+        total_sales = float(sales_cube['MTD SALES'].to_numpy()[mask].sum())
         st.metric("Total Sales", format_indian_money(total_sales))
 
     with col2:
-        total_bills = filtered_data['MTD BILLS'].sum()
+        total_bills = float(sales_cube['MTD BILLS'].to_numpy()[mask].sum())
         st.metric("Total Bills", format_indian_money(total_bills))
 
     with col3:
@@ -130,34 +621,37 @@ with tab1:
         st.metric("Average Bill Value", format_indian_money(avg_bill_value))
 
     with col4:
-        total_outlets = filtered_data['SALON NAMES'].nunique()
+        # Distinct outlet codes in the selection, ignoring missing names (-1)
+        outlet_codes = pd.unique(
+            sales_cube['SALON NAMES'].cat.codes.to_numpy()[mask])
+        total_outlets = int(np.count_nonzero(outlet_codes >= 0))
         st.metric("Total Outlets", f"{total_outlets}")
 
     # MTD Sales by Outlet
     st.subheader("Sales by Outlet")
 
+    # Only the charts below need the filtered rows themselves
+    filtered_data = sales_cube[mask]
+
     # Group by salon names and calculate totals
     salon_sales = filtered_data.groupby(
-        'SALON NAMES')['MTD SALES'].sum().reset_index()
+        'SALON NAMES', observed=True)['MTD SALES'].sum().reset_index()
     salon_sales = salon_sales.sort_values('MTD SALES', ascending=False)
 
-    fig = px.bar(
-        salon_sales,
-        x='SALON NAMES',
-        y='MTD SALES',
-        title="MTD Sales by Outlet",
-        labels={'MTD SALES': 'Sales', 'SALON NAMES': 'Outlet'},
-        color='MTD SALES',
-        color_continuous_scale='Viridis'
-    )
-
-    fig.update_traces(
-        text=salon_sales['MTD SALES'].apply(format_indian_money),
+    outlet_totals = salon_sales['MTD SALES'].to_numpy()
+    fig = go.Figure(go.Bar(
+        x=salon_sales['SALON NAMES'].to_numpy(),
+        y=outlet_totals,
+        marker=dict(color=outlet_totals, colorscale='Viridis',
+                    showscale=True),
+        texttemplate='₹%{y:,.0f}',
         textposition='outside',
-        hovertemplate='%{text}<extra></extra>'
-    )
+        hovertemplate='₹%{y:,.0f}<extra></extra>'
+    ))
     fig.update_layout(
+        title="MTD Sales by Outlet",
         xaxis={'categoryorder': 'total descending'},
+        xaxis_title='Outlet',
         yaxis_title='Sales'
     )
     st.plotly_chart(fig, use_container_width=True)
@@ -166,28 +660,27 @@ with tab1:
     if selected_month == "All":
         st.subheader("Monthly Sales Trend")
 
-        monthly_sales = filtered_data.groupby(['Month', 'Year'])[
+        monthly_sales = filtered_data.groupby(['Month', 'Year'], observed=True)[
             'MTD SALES'].sum().reset_index()
 
-        # Create a custom sort order for months
-        month_order = ['January', 'February', 'March', 'April', 'May', 'June',
-                       'July', 'August', 'September', 'October', 'November', 'December']
-        monthly_sales['Month_Sorted'] = pd.Categorical(
-            monthly_sales['Month'], categories=month_order, ordered=True)
-        monthly_sales = monthly_sales.sort_values('Month_Sorted')
+        # Month is an ordered categorical, so this sorts in calendar order
+        monthly_sales = monthly_sales.sort_values('Month')
 
-        fig = px.line(
-            monthly_sales,
-            x='Month',
-            y='MTD SALES',
-            color='Year',
+        fig = go.Figure()
+        for year, year_sales in monthly_sales.groupby('Year', observed=True, sort=True):
+            fig.add_trace(go.Scattergl(
+                x=year_sales['Month'].to_numpy(),
+                y=year_sales['MTD SALES'].to_numpy(),
+                mode='lines+markers',
+                name=str(year),
+                hovertemplate='₹%{y:,.0f}<extra></extra>'
+            ))
+        fig.update_layout(
             title="Monthly Sales Trend",
-            labels={'MTD SALES': 'Sales', 'Month': 'Month'},
-            markers=True
-        )
-        fig.update_traces(
-            hovertemplate='%{text}<extra></extra>',
-            text=monthly_sales['MTD SALES'].apply(format_indian_money)
+            xaxis={'categoryorder': 'array', 'categoryarray': MONTH_ORDER},
+            xaxis_title='Month',
+            yaxis_title='Sales',
+            legend_title='Year'
         )
         st.plotly_chart(fig, use_container_width=True)
 
@@ -195,60 +688,38 @@ with tab2:
     st.header("Outlet Comparison")
 
     # Select specific outlet to compare
-    outlet_list = sorted(sales_data['SALON NAMES'].unique())
+    outlet_list = prepared_state['outlets']
     selected_outlet = st.selectbox(
         "Select Outlet for Detailed Analysis", outlet_list)
 
-    # Filter data for the selected outlet
-    outlet_data = sales_data[sales_data['SALON NAMES'] == selected_outlet]
-
-    # Group data by year and month
-    outlet_yearly = outlet_data.groupby(['Year', 'Month'])[
-        'MTD SALES'].sum().reset_index()
-
-    # Create a custom sort order for months
-    month_order = ['January', 'February', 'March', 'April', 'May', 'June',
-                   'July', 'August', 'September', 'October', 'November', 'December']
-
-    # Create a mapping dictionary for month names
-    month_mapping = {
-        'Jan': 'January',
-        'Feb': 'February',
-        'Mar': 'March',
-        'Apr': 'April',
-        'May': 'May',
-        'Jun': 'June',
-        'Jul': 'July',
-        'Aug': 'August',
-        'Sep': 'September',
-        'Oct': 'October',
-        'Nov': 'November',
-        'Dec': 'December'
-    }
-
-    # Replace abbreviated month names with full names
-    outlet_yearly['Month'] = outlet_yearly['Month'].replace(month_mapping)
+    # Slice the selected outlet's monthly totals by year and month
+    outlet_monthly_cube = prepared_state['outlet_monthly_cube']
+    outlet_yearly = outlet_monthly_cube[column_mask(
+        outlet_monthly_cube['SALON NAMES'], selected_outlet)].drop(columns='SALON NAMES')
 
-    # Create the Month_Sorted column and sort
-    outlet_yearly['Month_Sorted'] = pd.Categorical(
-        outlet_yearly['Month'], categories=month_order, ordered=True)
-    outlet_yearly = outlet_yearly.sort_values(['Year', 'Month_Sorted'])
+    # Month is an ordered categorical, so this sorts in calendar order
+    outlet_yearly = outlet_yearly.sort_values(['Year', 'Month'])
 
     # Display yearly comparison chart
     st.subheader(f"{selected_outlet} - Yearly Comparison")
 
-    fig = px.bar(
-        outlet_yearly,
-        x='Month',
-        y='MTD SALES',
-        color='Year',
+    fig = go.Figure()
+    for year, year_sales in outlet_yearly.groupby('Year', observed=True, sort=True):
+        fig.add_trace(go.Bar(
+            x=year_sales['Month'].to_numpy(),
+            y=year_sales['MTD SALES'].to_numpy(),
+            name=str(year),
+            texttemplate='₹%{y:,.0f}',
+            textposition='outside',
+            hovertemplate='₹%{y:,.0f}<extra></extra>'
+        ))
+    fig.update_layout(
         barmode='stack',
         title=f"Monthly Sales for {selected_outlet} by Year",
-        labels={'MTD SALES': 'Sales', 'Month': 'Month', 'Year': 'Year'}
-    )
-    fig.update_traces(
-        hovertemplate='%{text}<extra></extra>',
-        text=outlet_yearly['MTD SALES'].apply(format_indian_money)
+        xaxis={'categoryorder': 'array', 'categoryarray': MONTH_ORDER},
+        xaxis_title='Month',
+        yaxis_title='Sales',
+        legend_title='Year'
     )
     st.plotly_chart(fig, use_container_width=True)
 
@@ -259,29 +730,26 @@ with tab2:
         try:
             # Pivot data for easier comparison
             pivot_data = outlet_yearly.pivot_table(
-                index='Month_Sorted',
+                index='Month',
                 columns='Year',
-                values='MTD SALES'
+                values='MTD SALES',
+                observed=True
             ).reset_index()
 
             # Get years from the pivot table columns
-            years = [col for col in pivot_data.columns if col != 'Month_Sorted']
+            years = [col for col in pivot_data.columns if col != 'Month']
 
             if len(years) > 1:
-                # Calculate YoY growth percentages
-                for i in range(1, len(years)):
-                    current_year = years[i]
-                    prev_year = years[i-1]
-                    colname = f"Growth {prev_year} to {current_year}"
-                    pivot_data[colname] = (
-                        (pivot_data[current_year] / pivot_data[prev_year]) - 1) * 100
-                    # Format the growth percentage with % symbol
-                    pivot_data[colname] = pivot_data[colname].apply(
-                        lambda x: f"{x:.2f}%")
+                # Calculate YoY growth percentages for all year pairs at once,
+                # leaving months without prior-year sales empty
+                sales_block = pivot_data[years].to_numpy(dtype=float)
+                prev_block = sales_block[:, :-1]
+                growth_block = (sales_block[:, 1:] / np.where(
+                    prev_block == 0, np.nan, prev_block) - 1) * 100
+                pivot_data[[f"Growth {years[i-1]} to {years[i]}"
+                            for i in range(1, len(years))]] = growth_block
 
                 # Display the growth table
-                pivot_data = pivot_data.rename(
-                    columns={'Month_Sorted': 'Month'})
                 pivot_data['Month'] = pivot_data['Month'].astype(str)
 
                 # Only show growth columns
@@ -294,15 +762,17 @@ with tab2:
 
                     # Calculate projected values (110% of latest year)
                     pivot_data['Projected (10% Growth)'] = pivot_data[latest_year] * 1.10
-                    # Format the projected values with currency symbol and Indian comma format
-                    pivot_data['Projected (10% Growth)'] = pivot_data['Projected (10% Growth)'].apply(
-                        lambda x: format_indian_money(x)
-                    )
 
-                    # Format the year columns with Indian comma format
-                    for year in years:
-                        pivot_data[year] = pivot_data[year].apply(
-                            lambda x: format_indian_money(x))
+                    # Format all growth percentages with % symbol in one pass,
+                    # blank where there were no prior-year sales
+                    pivot_data[growth_cols] = format_percent_array(
+                        pivot_data[growth_cols].to_numpy(dtype=float), missing="")
+
+                    # Format the year and projected columns with currency symbol
+                    # and Indian comma format as one block
+                    money_cols = years + ['Projected (10% Growth)']
+                    pivot_data[money_cols] = format_indian_money_array(
+                        pivot_data[money_cols].to_numpy(dtype=float))
 
                     # Update display columns to include projected growth
                     display_cols = ['Month'] + years + \
@@ -323,26 +793,18 @@ with tab2:
                 f"Please ensure {selected_outlet} has data for multiple years and months.")
 
     # Daily Sales Analysis
-    if 'DAY SALES' in sales_data.columns:
+    daily_cube = prepared_state['daily_cube']
+    if daily_cube is not None:
         st.subheader("Daily Sales Analysis")
 
-        # Display day-wise sales if available
-        outlet_daily = sales_data[
-            (sales_data['SALON NAMES'] == selected_outlet) &
-            # Changed from notna to ~pd.isna for clarity
-            (~pd.isna(sales_data['DAY SALES'])) &
-            # Additional check for empty strings
-            (sales_data['DAY SALES'] != '') &
-            # Additional check for zero values
-            (sales_data['DAY SALES'] != 0)
-        ]
-
-        if not outlet_daily.empty:
-            # Group by day and calculate averages
-            try:
-                daily_avg = outlet_daily.groupby(['Year', 'Month', 'DAY SALES'])[
-                    'MTD SALES'].mean().reset_index()
+        # Display day-wise averages if available, sliced from the daily cube
+        daily_avg = daily_cube[column_mask(
+            daily_cube['SALON NAMES'], selected_outlet)].drop(columns='SALON NAMES')
 
+        if not daily_avg.empty:
+            try:
+                # WebGL lines with Plotly-side number formatting, so no
+                # per-point label strings are built or sent to the browser
                 fig = px.line(
                     daily_avg,
                     x='DAY SALES',
@@ -350,11 +812,11 @@ with tab2:
                     color='Year',
                     line_group='Month',
                     title=f"Daily Sales for {selected_outlet}",
-                    labels={'MTD SALES': 'Sales (₹)', 'DAY SALES': 'Day'}
+                    labels={'MTD SALES': 'Sales (₹)', 'DAY SALES': 'Day'},
+                    render_mode='webgl'
                 )
                 fig.update_traces(
-                    hovertemplate='%{text}<extra></extra>',
-                    text=daily_avg['MTD SALES'].apply(format_indian_money)
+                    hovertemplate='₹%{y:,.0f}<extra></extra>'
                 )
                 st.plotly_chart(fig, use_container_width=True)
             except Exception as e:
@@ -373,9 +835,8 @@ with tab3:
 
     try:
         # Load category data if available in S3
-        category_file_key = f"{S3_PREFIX}outputs/Hair___skin__spa_and_products___For_each_20250326_222907.csv"
-        if check_file_exists_in_s3(S3_BUCKET, category_file_key):
-            category_data = read_csv_from_s3(S3_BUCKET, category_file_key)
+        category_data = load_category_data()
+        if category_data is not None:
 
             # Check if Year column exists in category data
             if 'Year' in category_data.columns and len(category_data['Year'].unique()) > 1:
@@ -420,9 +881,8 @@ with tab3:
             )
 
             # Pre-format values for hover display
-            business_unit_sales['formatted_sales'] = business_unit_sales['Total_Sales'].apply(
-                lambda x: format_indian_money(x).replace('₹', '')
-            )
+            business_unit_sales['formatted_sales'] = format_indian_money_array(
+                business_unit_sales['Total_Sales'].to_numpy(), symbol='')
 
             fig_bu.update_traces(
                 text=business_unit_sales['formatted_sales'],
@@ -438,9 +898,8 @@ with tab3:
             top_categories['Display_Sales'] = top_categories['Total_Sales'] / divisor
 
             # Create bar chart for top 15 categories
-            top_categories['formatted_sales'] = top_categories['Total_Sales'].apply(
-                lambda x: format_indian_money(x).replace('₹', '')
-            )
+            top_categories['formatted_sales'] = format_indian_money_array(
+                top_categories['Total_Sales'].to_numpy(), symbol='')
 
             fig_cat = px.bar(
                 top_categories,
@@ -486,9 +945,9 @@ with tab3:
                 )
 
                 # Update display for parent nodes
-                for i in range(len(fig_tree.data[0].ids)):
-                    if fig_tree.data[0].parents[i] == '':  # Root node
-                        fig_tree.data[0].texttemplate = '%{label}<br>Total: ₹%{value:,.0f}'
+                tree_trace = fig_tree.data[0]
+                if '' in tree_trace.parents:  # Root node
+                    tree_trace.texttemplate = '%{label}<br>Total: ₹%{value:,.0f}'
 
                 st.plotly_chart(fig_tree, use_container_width=True)
 
@@ -498,26 +957,34 @@ with tab3:
             # Add table with top categories by business unit
             st.subheader("Top Categories by Business Unit")
 
-            # Create pivot table
-            pivot = pd.pivot_table(
-                category_data,
-                values=['Total_Sales', 'Total_Quantity'],
-                index='Item Category',
-                columns='Business Unit',
-                aggfunc='sum',
-                fill_value=0
+            # Sum per category and business unit, then spread business units
+            # into columns
+            pivot = category_data.groupby(
+                ['Item Category', 'Business Unit'], observed=True
+            )[['Total_Quantity', 'Total_Sales']].sum().unstack('Business Unit', fill_value=0)
+
+            # Rank categories by total sales and only send the top rows to the
+            # browser unless the full table is requested
+            category_totals = pivot['Total_Sales'].sum(axis=1)
+            pivot = pivot.loc[category_totals.sort_values(ascending=False).index]
+            show_all_categories = st.checkbox(
+                f"Show all {len(pivot)} categories", value=False)
+            if not show_all_categories:
+                pivot = pivot.head(TOP_CATEGORY_ROWS)
+
+            # Format the whole sales block with ₹ symbol and Indian comma format
+            sales_block = pivot['Total_Sales'].to_numpy(dtype=float)
+            formatted_sales = pd.DataFrame(
+                np.where(sales_block > 0,
+                         format_indian_money_array(sales_block), ""),
+                index=pivot.index,
+                columns=pivot['Total_Sales'].columns
             )
-
-            # Format for display - flatten columns and format values
-            pivot_flat = pivot.reset_index()
-            formatted_pivot = pivot_flat.copy()
-
-            # Format the sales columns with ₹ symbol and Indian comma format
-            for col in formatted_pivot.columns:
-                if isinstance(col, tuple) and col[0] == 'Total_Sales':
-                    formatted_pivot[col] = formatted_pivot[col].apply(
-                        lambda x: format_indian_money(x) if x > 0 else ""
-                    )
+            formatted_pivot = pd.concat(
+                {'Total_Quantity': pivot['Total_Quantity'],
+                 'Total_Sales': formatted_sales},
+                axis=1
+            ).reset_index()
 
             st.dataframe(formatted_pivot, use_container_width=True)
 
@@ -536,23 +1003,21 @@ with tab3:
             filter_cols = st.columns(3)
 
             with filter_cols[0]:
-                service_years = sorted(service_data['Year'].unique())
+                service_years = prepared_state['service_years']
                 selected_service_year = st.selectbox(
                     "Select Year", service_years)
 
-                center_names = sorted(service_data['Center Name'].unique())
+                center_names = prepared_state['centers']
                 selected_center = st.selectbox(
-                    "Select Center", ["All"] + list(center_names))
+                    "Select Center", ["All"] + center_names)
 
             with filter_cols[1]:
-                item_categories = ["All"] + \
-                    sorted(service_data['Service_Type'].unique())
+                item_categories = ["All"] + prepared_state['service_types']
                 selected_item_category = st.selectbox(
                     "Select Service Type", item_categories)
 
                 if 'Item Category' in service_data.columns:
-                    subcategories = [
-                        "All"] + sorted(service_data['Item Category'].dropna().unique())
+                    subcategories = ["All"] + prepared_state['item_categories']
                     selected_subcategory = st.selectbox(
                         "Select Item Category", subcategories)
                 else:
@@ -560,8 +1025,7 @@ with tab3:
 
             with filter_cols[2]:
                 if 'Business Unit' in service_data.columns:
-                    business_units = [
-                        "All"] + sorted(service_data['Business Unit'].dropna().unique())
+                    business_units = ["All"] + prepared_state['business_units']
                     selected_business_unit = st.selectbox(
                         "Select Business Unit", business_units)
                 else:
@@ -569,82 +1033,53 @@ with tab3:
 
                 if 'Item Subcategory' in service_data.columns:
                     item_subcategories = [
-                        "All"] + sorted(service_data['Item Subcategory'].dropna().unique())
+                        "All"] + prepared_state['item_subcategories']
                     selected_item_subcategory = st.selectbox(
                         "Select Item Subcategory", item_subcategories)
                 else:
                     selected_item_subcategory = "All"
 
-        # Filter service data
-        filtered_service_data = service_data.copy()
-        filtered_service_data = filtered_service_data[filtered_service_data['Year']
-                                                      == selected_service_year]
-
-        if selected_center != "All":
-            filtered_service_data = filtered_service_data[
-                filtered_service_data['Center Name'] == selected_center]
-
-        if selected_item_category != "All":
-            filtered_service_data = filtered_service_data[filtered_service_data['Service_Type']
-                                                          == selected_item_category]
-
-        if selected_subcategory != "All" and 'Item Category' in filtered_service_data.columns:
-            filtered_service_data = filtered_service_data[
-                filtered_service_data['Item Category'] == selected_subcategory]
-
-        if selected_business_unit != "All" and 'Business Unit' in filtered_service_data.columns:
-            filtered_service_data = filtered_service_data[
-                filtered_service_data['Business Unit'] == selected_business_unit]
+        # Build one mask for every filter except the year, shared by the
+        # filtered and breakdown views
+        service_filter_mask = build_mask(service_cube, [
+            ('Center Name', selected_center),
+            ('Service_Type', selected_item_category),
+            ('Item Category', selected_subcategory),
+            ('Business Unit', selected_business_unit),
+            ('Item Subcategory', selected_item_subcategory)
+        ])
 
-        if selected_item_subcategory != "All" and 'Item Subcategory' in filtered_service_data.columns:
-            filtered_service_data = filtered_service_data[
-                filtered_service_data['Item Subcategory'] == selected_item_subcategory]
+        # Filter service data
+        filtered_service_data = service_cube[service_filter_mask & column_mask(
+            service_cube['Year'], selected_service_year)]
 
         # Service Categories Analysis
         st.subheader("Service Categories Breakdown")
 
         # Add year filter with "Total" option
-        year_options = ["Total"] + \
-            sorted(service_data['Year'].unique(), reverse=True)
+        year_options = ["Total"] + prepared_state['service_years'][::-1]
         selected_breakdown_year = st.selectbox(
             "Select Year for Breakdown", year_options)
 
         # Filter data based on selected year or use all years
         if selected_breakdown_year == "Total":
-            breakdown_data = service_data.copy()  # Use all data
+            breakdown_data = service_cube[service_filter_mask]
             year_title = "All Years"
         else:
-            breakdown_data = service_data[service_data['Year']
-                                          == selected_breakdown_year].copy()
+            breakdown_data = service_cube[service_filter_mask & column_mask(
+                service_cube['Year'], selected_breakdown_year)]
             year_title = selected_breakdown_year
 
-        # Apply other filters except year
-        if selected_center != "All":
-            breakdown_data = breakdown_data[
-                breakdown_data['Center Name'] == selected_center]
-
-        if selected_item_category != "All":
-            breakdown_data = breakdown_data[breakdown_data['Service_Type']
-                                            == selected_item_category]
-
-        if selected_subcategory != "All" and 'Item Category' in breakdown_data.columns:
-            breakdown_data = breakdown_data[
-                breakdown_data['Item Category'] == selected_subcategory]
-
-        if selected_business_unit != "All" and 'Business Unit' in breakdown_data.columns:
-            breakdown_data = breakdown_data[
-                breakdown_data['Business Unit'] == selected_business_unit]
-
-        if selected_item_subcategory != "All" and 'Item Subcategory' in breakdown_data.columns:
-            breakdown_data = breakdown_data[
-                breakdown_data['Item Subcategory'] == selected_item_subcategory]
+        # Sum sales and transactions per service category once for the pie
+        # chart and the metrics table below
+        service_type_totals = breakdown_data.groupby('Service_Type', observed=True)[
+            ['Total_Sales', 'Transaction_Count']].sum().reset_index()
 
         col1, col2 = st.columns(2)
 
         with col1:
             # Calculate metrics by service category
-            category_sales = breakdown_data.groupby(
-                'Service_Type')['Total_Sales'].sum().reset_index()
+            category_sales = service_type_totals[['Service_Type', 'Total_Sales']].copy()
 
             # Create a mapping for more readable service names
             service_name_mapping = {
@@ -661,17 +1096,15 @@ with tab3:
             )
 
             # Create service category visualization
-            fig = px.pie(
-                category_sales,
-                values='Total_Sales',
-                names='Display_Name',  # Use the display name
-                title=f"Sales Distribution by Category ({year_title})",
-                labels={'Total_Sales': 'Sales (in Lakhs)'},
+            fig = go.Figure(go.Pie(
+                labels=category_sales['Display_Name'].to_numpy(),  # Use the display name
+                values=category_sales['Total_Sales'].to_numpy(),
                 hole=0.4,
-                color_discrete_sequence=px.colors.qualitative.G10
-            )
-            fig.update_traces(
-                hovertemplate='₹%{y:,.0f}<extra></extra>'
+                marker=dict(colors=px.colors.qualitative.G10),
+                hovertemplate='%{label}<br>₹%{value:,.0f}<extra></extra>'
+            ))
+            fig.update_layout(
+                title=f"Sales Distribution by Category ({year_title})"
             )
             st.plotly_chart(fig, use_container_width=True)
 
@@ -679,7 +1112,7 @@ with tab3:
             st.subheader("Service vs Product Sales")
 
             service_product = breakdown_data.groupby(
-                'Category')['Total_Sales'].sum().reset_index()
+                'Category', observed=True)['Total_Sales'].sum().reset_index()
 
             # Create a mapping for more readable category names
             category_name_mapping = {
@@ -707,10 +1140,7 @@ with tab3:
         # Display detailed service category metrics
         st.subheader(f"Service Category Metrics ({year_title})")
 
-        category_details = breakdown_data.groupby('Service_Type').agg({
-            'Total_Sales': 'sum',
-            'Transaction_Count': 'sum'
-        }).reset_index()
+        category_details = service_type_totals.copy()
 
         category_details['Average_Transaction'] = category_details['Total_Sales'] / \
             category_details['Transaction_Count']
@@ -721,10 +1151,10 @@ with tab3:
         )
 
         # Format for display
-        category_details['Total_Sales'] = category_details['Total_Sales'].apply(
-            lambda x: format_indian_money(x, 'lakhs'))
-        category_details['Average_Transaction'] = category_details['Average_Transaction'].apply(
-            lambda x: format_indian_money(x, 'lakhs'))
+        category_details['Total_Sales'] = format_indian_money_array(
+            category_details['Total_Sales'].to_numpy())
+        category_details['Average_Transaction'] = format_indian_money_array(
+            category_details['Average_Transaction'].to_numpy())
 
         # Rename columns for display
         category_details.columns = [
@@ -736,7 +1166,7 @@ with tab3:
         st.subheader(f"Center-wise Service Analysis ({year_title})")
 
         # Group by center and calculate totals
-        center_sales = breakdown_data.groupby('Center Name').agg({
+        center_sales = breakdown_data.groupby('Center Name', observed=True).agg({
             'Total_Sales': 'sum',
             'Transaction_Count': 'sum'
         }).reset_index()
@@ -746,20 +1176,20 @@ with tab3:
         center_sales = center_sales.sort_values('Total_Sales', ascending=False)
 
         # Create center sales bar chart
-        fig = px.bar(
-            center_sales,
-            x='Center Name',
-            y='Total_Sales',
-            title=f"Total Sales by Center ({year_title})",
-            color='Total_Sales',
-            labels={
-                'Total_Sales': 'Sales', 'Center Name': 'Center'},
-            text='Total_Sales'
-        )
-        fig.update_traces(
+        center_totals = center_sales['Total_Sales'].to_numpy()
+        fig = go.Figure(go.Bar(
+            x=center_sales['Center Name'].to_numpy(),
+            y=center_totals,
+            marker=dict(color=center_totals, showscale=True),
+            text=center_totals,
             texttemplate='₹%{text:,.0f}',
             textposition='outside',
-            hovertemplate='₹%{text:,.0f}<extra></extra>'
+            hovertemplate='₹%{y:,.0f}<extra></extra>'
+        ))
+        fig.update_layout(
+            title=f"Total Sales by Center ({year_title})",
+            xaxis_title='Center',
+            yaxis_title='Sales'
         )
         st.plotly_chart(fig, use_container_width=True)
 
@@ -768,8 +1198,7 @@ with tab3:
             st.subheader("Center Performance Across Years")
 
             # Group by center and year
-            yearly_center_sales = service_data.groupby(['Center Name', 'Year'])[
-                'Total_Sales'].sum().reset_index()
+            yearly_center_sales = prepared_state['center_year_sales']
 
             # Create a comparison visualization
             fig = px.bar(
@@ -790,42 +1219,26 @@ with tab3:
             # Calculate year-over-year growth for centers
             st.subheader("Center Growth Analysis")
 
-            # Create a pivot table for easier comparison
-            center_pivot = yearly_center_sales.pivot_table(
+            # Reshape into one row per center; the totals are already unique
+            # per center and year, so no aggregation is needed
+            center_pivot = yearly_center_sales.pivot(
                 index='Center Name',
                 columns='Year',
                 values='Total_Sales'
             ).reset_index()
 
-            # Calculate growth percentages between years
-            years = sorted(service_data['Year'].unique())
-            growth_data = []
-
-            for center in center_pivot['Center Name']:
-                center_row = {'Center Name': center}
-
-                for i in range(1, len(years)):
-                    current_year = years[i]
-                    prev_year = years[i-1]
-
-                    # Get sales values
-                    prev_sales = center_pivot.loc[center_pivot['Center Name']
-                                                  == center, prev_year].values[0]
-                    current_sales = center_pivot.loc[center_pivot['Center Name']
-                                                     == center, current_year].values[0]
-
-                    # Calculate growth
-                    if prev_sales > 0:
-                        growth_pct = ((current_sales / prev_sales) - 1) * 100
-                    else:
-                        growth_pct = float('inf')
-
-                    # Add to row
-                    center_row[f'Growth {prev_year} to {current_year}'] = growth_pct
+            # Calculate growth percentages between years for all centers at
+            # once; centers without prior-year sales get no growth value
+            years = prepared_state['service_years']
+            center_sales_by_year = center_pivot.set_index('Center Name')[years]
+            center_growth = center_sales_by_year.pct_change(
+                axis=1, fill_method=None).iloc[:, 1:] * 100
+            center_growth.columns = [
+                f'Growth {years[i-1]} to {years[i]}' for i in range(1, len(years))]
+            center_growth = center_growth.replace([np.inf, -np.inf], np.nan)
 
-                growth_data.append(center_row)
-
-            growth_df = pd.DataFrame(growth_data)
+            growth_df = pd.concat(
+                [center_sales_by_year, center_growth], axis=1).reset_index()
 
             # Sort by the most recent growth
             if len(years) > 1:
@@ -834,45 +1247,20 @@ with tab3:
                     latest_growth_col, ascending=False)
 
             # Create growth chart
-            growth_cols = [col for col in growth_df.columns if 'Growth' in col]
+            growth_cols = list(center_growth.columns)
 
             if growth_cols:
-                melted_growth = pd.melt(
-                    growth_df,
-                    id_vars=['Center Name'],
-                    value_vars=growth_cols,
-                    var_name='Period',
-                    value_name='Growth (%)'
-                )
-
-                fig = px.bar(
-                    melted_growth,
-                    x='Center Name',
-                    y='Growth (%)',
-                    color='Period',
-                    barmode='group',
-                    title="Year-over-Year Growth by Center (%)",
-                    labels={'Growth (%)': 'Growth %', 'Center Name': 'Center'},
-                    text='Growth (%)'
-                )
-                fig.update_traces(
-                    texttemplate='₹%{text:,.1f}%', textposition='outside'
-                )
-                fig.update_traces(
-                    hovertemplate='₹%{y:,.0f}<extra></extra>'
-                )
+                fig = center_growth_chart(growth_df, growth_cols)
                 st.plotly_chart(fig, use_container_width=True)
 
                 # Format growth data for display
                 display_growth = growth_df.copy()
-                for col in growth_cols:
-                    display_growth[col] = display_growth[col].apply(
-                        lambda x: f"{x:.2f}%" if not pd.isna(x) and not np.isinf(x) else "N/A")
+                display_growth[growth_cols] = format_percent_array(
+                    growth_df[growth_cols].to_numpy(dtype=float), missing="N/A")
 
                 # Format sales columns with Indian comma format
-                for year in years:
-                    display_growth[year] = display_growth[year].apply(
-                        lambda x: format_indian_money(x))
+                display_growth[years] = format_indian_money_array(
+                    growth_df[years].to_numpy(dtype=float))
 
                 st.dataframe(display_growth, use_container_width=True)
     else:
@@ -880,8 +1268,7 @@ with tab3:
             "Service data is not available or was too large to process. Using only sales data for this analysis.")
 
         # Display brand-based analysis instead
-        brand_sales = sales_data.groupby(['BRAND', 'Year'])[
-            'MTD SALES'].sum().reset_index()
+        brand_sales = prepared_state['brand_year_sales']
 
         fig = px.bar(
             brand_sales,
@@ -900,8 +1287,7 @@ with tab3:
         # Add comparison of salon names
         st.subheader("Salon Names Comparison Across Years")
 
-        salon_yearly_sales = sales_data.groupby(['SALON NAMES', 'Year'])[
-            'MTD SALES'].sum().reset_index()
+        salon_yearly_sales = prepared_state['salon_year_sales']
 
         fig = px.bar(
             salon_yearly_sales,
@@ -922,17 +1308,14 @@ with tab4:
     st.header("Growth Analysis")
 
     # Year selection
-    years = sorted(sales_data['Year'].unique())
+    years = prepared_state['years']
 
     # Display overall growth from first to last year if we have at least 2023 and 2025
     if '2023' in years and '2025' in years:
         st.subheader("Total Growth from 2023 to 2025")
 
-        data_2023 = sales_data[sales_data['Year'] == '2023']
-        data_2025 = sales_data[sales_data['Year'] == '2025']
-
-        total_2023 = data_2023['MTD SALES'].sum()
-        total_2025 = data_2025['MTD SALES'].sum()
+        total_2023 = prepared_state['year_sales']['2023']
+        total_2025 = prepared_state['year_sales']['2025']
 
         overall_growth = ((total_2025 / total_2023) - 1) * 100
 
@@ -950,16 +1333,9 @@ with tab4:
             st.metric("2-Year Growth", f"{overall_growth:.2f}%")
 
         # Calculate outlet-specific growth from 2023 to 2025
-        salon_2023 = data_2023.groupby('SALON NAMES')[
-            'MTD SALES'].sum().reset_index()
-        salon_2025 = data_2025.groupby('SALON NAMES')[
-            'MTD SALES'].sum().reset_index()
-
-        salon_growth = pd.merge(
-            salon_2023, salon_2025,
-            on='SALON NAMES',
-            suffixes=('_2023', '_2025')
-        )
+        salon_growth = year_pair(
+            prepared_state['salon_year_sales'], 'SALON NAMES',
+            '2023', '2025', suffixes=('_2023', '_2025'))
 
         salon_growth['Growth_Amount'] = salon_growth['MTD SALES_2025'] - \
             salon_growth['MTD SALES_2023']
@@ -969,22 +1345,8 @@ with tab4:
             'Growth_Percent', ascending=False)
 
         # Display the 2-year growth chart
-        fig = px.bar(
-            salon_growth,
-            x='SALON NAMES',
-            y='Growth_Percent',
-            title="Total Growth by Outlet (2023 to 2025)",
-            labels={'Growth_Percent': 'Growth (%)', 'SALON NAMES': 'Outlet'},
-            color='Growth_Percent',
-            color_continuous_scale='RdYlGn',
-            text='Growth_Percent'
-        )
-        fig.update_traces(
-            texttemplate='%{text:.2f}%', textposition='outside'
-        )
-        fig.update_traces(
-            hovertemplate='%{text}<extra></extra>'
-        )
+        fig = outlet_growth_chart(
+            salon_growth, "Total Growth by Outlet (2023 to 2025)")
         st.plotly_chart(fig, use_container_width=True)
 
     if len(years) >= 2:
@@ -999,19 +1361,10 @@ with tab4:
             compare_year = st.selectbox(
                 "Comparison Year", [y for y in years if y > base_year], index=0)
 
-        # Filter data for selected years
-        base_data = sales_data[sales_data['Year'] == base_year]
-        compare_data = sales_data[sales_data['Year'] == compare_year]
-
-        # Group by salon
-        base_by_salon = base_data.groupby(
-            'SALON NAMES')['MTD SALES'].sum().reset_index()
-        compare_by_salon = compare_data.groupby(
-            'SALON NAMES')['MTD SALES'].sum().reset_index()
-
-        # Merge data
-        growth_data = pd.merge(base_by_salon, compare_by_salon,
-                               on='SALON NAMES', suffixes=('_base', '_compare'))
+        # Salon totals of both years side by side
+        growth_data = year_pair(
+            prepared_state['salon_year_sales'], 'SALON NAMES',
+            base_year, compare_year, suffixes=('_base', '_compare'))
 
         # Calculate growth
         growth_data['Growth_Amount'] = growth_data['MTD SALES_compare'] - \
@@ -1026,22 +1379,9 @@ with tab4:
         # Display growth chart
         st.subheader(f"Growth Analysis: {base_year} to {compare_year}")
 
-        fig = px.bar(
+        fig = outlet_growth_chart(
             growth_data,
-            x='SALON NAMES',
-            y='Growth_Percent',
-            title=f"Growth Percentage by Outlet ({base_year} to {compare_year})",
-            labels={'Growth_Percent': 'Growth (%)', 'SALON NAMES': 'Outlet'},
-            color='Growth_Percent',
-            color_continuous_scale='RdYlGn',
-            text='Growth_Percent'
-        )
-        fig.update_traces(
-            texttemplate='%{text:.2f}%', textposition='outside'
-        )
-        fig.update_traces(
-            hovertemplate='%{text}<extra></extra>'
-        )
+            f"Growth Percentage by Outlet ({base_year} to {compare_year})")
         st.plotly_chart(fig, use_container_width=True)
 
         # Display growth table
@@ -1049,14 +1389,11 @@ with tab4:
 
         # Format the table
         display_growth = growth_data.copy()
-        display_growth['MTD SALES_base'] = display_growth['MTD SALES_base'].apply(
-            lambda x: format_indian_money(x))
-        display_growth['MTD SALES_compare'] = display_growth['MTD SALES_compare'].apply(
-            lambda x: format_indian_money(x))
-        display_growth['Growth_Amount'] = display_growth['Growth_Amount'].apply(
-            lambda x: format_indian_money(x))
-        display_growth['Growth_Percent'] = display_growth['Growth_Percent'].apply(
-            lambda x: f"{x:.2f}%")
+        money_cols = ['MTD SALES_base', 'MTD SALES_compare', 'Growth_Amount']
+        display_growth[money_cols] = format_indian_money_array(
+            growth_data[money_cols].to_numpy(dtype=float))
+        display_growth['Growth_Percent'] = format_percent_array(
+            growth_data['Growth_Percent'].to_numpy())
 
         # Rename columns for display
         display_growth.columns = [
@@ -1067,8 +1404,8 @@ with tab4:
         # Overall growth
         st.subheader("Overall Business Growth")
 
-        total_base = base_data['MTD SALES'].sum()
-        total_compare = compare_data['MTD SALES'].sum()
+        total_base = prepared_state['year_sales'][base_year]
+        total_compare = prepared_state['year_sales'][compare_year]
         overall_growth = ((total_compare / total_base) - 1) * 100
 
         col1, col2, col3 = st.columns(3)
@@ -1088,125 +1425,32 @@ with tab4:
         # Month-by-month growth visualization
         st.subheader("Month-by-Month Growth")
 
-        # Aggregate by month for both years
-        base_monthly = base_data.groupby(
-            'Month')['MTD SALES'].sum().reset_index()
-        compare_monthly = compare_data.groupby(
-            'Month')['MTD SALES'].sum().reset_index()
-
-        # Merge the data
-        monthly_growth = pd.merge(
-            base_monthly, compare_monthly, on='Month', suffixes=('_base', '_compare'))
+        # Monthly totals of both years side by side
+        monthly_growth = year_pair(
+            prepared_state['month_year_sales'], 'Month',
+            base_year, compare_year, suffixes=('_base', '_compare'))
         monthly_growth['Growth_Percent'] = (
             (monthly_growth['MTD SALES_compare'] / monthly_growth['MTD SALES_base']) - 1) * 100
 
-        # Create a custom sort order for months
-        month_order = ['January', 'February', 'March', 'April', 'May', 'June',
-                       'July', 'August', 'September', 'October', 'November', 'December']
-        monthly_growth['Month_Sorted'] = pd.Categorical(
-            monthly_growth['Month'], categories=month_order, ordered=True)
-        monthly_growth = monthly_growth.sort_values('Month_Sorted')
+        # Month is an ordered categorical, so this sorts in calendar order
+        monthly_growth = monthly_growth.sort_values('Month')
 
         # Create the visualization
-        fig = make_subplots(specs=[[{"secondary_y": True}]])
-
-        # Add bar chart for growth percentage
-        fig.add_trace(
-            go.Bar(
-                x=monthly_growth['Month'],
-                y=monthly_growth['Growth_Percent'],
-                name='Growth %',
-                marker_color='lightgreen'
-            ),
-            secondary_y=False
-        )
-
-        # Add line charts for sales values
-        fig.add_trace(
-            go.Scatter(
-                x=monthly_growth['Month'],
-                y=monthly_growth['MTD SALES_base'],
-                name=f'Sales {base_year}',
-                mode='lines+markers',
-                line=dict(color='blue')
-            ),
-            secondary_y=True
-        )
-
-        fig.add_trace(
-            go.Scatter(
-                x=monthly_growth['Month'],
-                y=monthly_growth['MTD SALES_compare'],
-                name=f'Sales {compare_year}',
-                mode='lines+markers',
-                line=dict(color='red')
-            ),
-            secondary_y=True
-        )
-
-        fig.update_layout(
-            title=f"Monthly Sales Comparison: {base_year} vs {compare_year}",
-            hovermode="x unified"
-        )
-
-        fig.update_yaxes(
-            title_text="Growth (%)",
-            secondary_y=False
-        )
-        fig.update_yaxes(
-            title_text="Sales (in Lakhs)",
-            secondary_y=True
-        )
-        fig.update_traces(
-            hovertemplate='%{text}<extra></extra>'
-        )
-
+        fig = monthly_comparison_chart(monthly_growth, base_year, compare_year)
         st.plotly_chart(fig, use_container_width=True)
 
         # Brand comparison
         st.subheader("Brand Performance Comparison")
 
-        # Group by brand
-        brand_base = base_data.groupby(
-            'BRAND')['MTD SALES'].sum().reset_index()
-        brand_compare = compare_data.groupby(
-            'BRAND')['MTD SALES'].sum().reset_index()
-
-        # Merge brand data
-        brand_growth = pd.merge(brand_base, brand_compare,
-                                on='BRAND', suffixes=('_base', '_compare'))
+        # Brand totals of both years side by side
+        brand_growth = year_pair(
+            prepared_state['brand_year_sales'], 'BRAND',
+            base_year, compare_year, suffixes=('_base', '_compare'))
         brand_growth['Growth_Percent'] = (
             (brand_growth['MTD SALES_compare'] / brand_growth['MTD SALES_base']) - 1) * 100
 
         # Create visualization
-        fig = px.bar(
-            brand_growth,
-            x='BRAND',
-            y=['MTD SALES_base', 'MTD SALES_compare'],
-            title=f"Brand Performance: {base_year} vs {compare_year}",
-            barmode='group',
-            labels={
-                'value': 'Sales (₹)',
-                'BRAND': 'Brand',
-                'variable': 'Year'
-            }
-        )
-        fig.update_traces(
-            hovertemplate='%{text}<extra></extra>'
-        )
-
-        # Add growth percentage as text
-        for i, brand in enumerate(brand_growth['BRAND']):
-            growth_pct = brand_growth.iloc[i]['Growth_Percent']
-            fig.add_annotation(
-                x=brand,
-                y=max(brand_growth.iloc[i]['MTD SALES_base'],
-                      brand_growth.iloc[i]['MTD SALES_compare']),
-                text=f"{growth_pct:.1f}%",
-                showarrow=True,
-                arrowhead=1
-            )
-
+        fig = brand_comparison_chart(brand_growth, base_year, compare_year)
         st.plotly_chart(fig, use_container_width=True)
     else:
         st.warning(
@@ -1215,8 +1459,8 @@ with tab4:
     # T Nagar Specific Analysis (as mentioned in requirements)
     st.header("T NAGAR Outlet Analysis")
 
-    # Filter data for T NAGAR
-    t_nagar_data = sales_data[sales_data['SALON NAMES'] == 'T NAGAR']
+    # T NAGAR rows and yearly totals are computed once with the prepared state
+    t_nagar_data, t_nagar_yearly = prepared_state['t_nagar']
 
     if not t_nagar_data.empty:
         t_nagar_years = sorted(t_nagar_data['Year'].unique())
@@ -1235,32 +1479,23 @@ with tab4:
         )
         fig.update_traces(
             hovertemplate='%{text}<extra></extra>',
-            text=t_nagar_data['MTD SALES'].apply(format_indian_money)
+            text=format_indian_money_array(t_nagar_data['MTD SALES'].to_numpy())
         )
         st.plotly_chart(fig, use_container_width=True)
 
         # Display growth metrics if multiple years
         if len(t_nagar_years) > 1:
-            # Calculate year-over-year growth
-            t_nagar_yearly = t_nagar_data.groupby(
-                'Year')['MTD SALES'].sum().reset_index()
-
-            # Calculate growth percentages
-            t_nagar_growth = []
-            for i in range(1, len(t_nagar_yearly)):
-                current_year = t_nagar_yearly.iloc[i]['Year']
-                prev_year = t_nagar_yearly.iloc[i-1]['Year']
-                current_sales = t_nagar_yearly.iloc[i]['MTD SALES']
-                prev_sales = t_nagar_yearly.iloc[i-1]['MTD SALES']
-                growth_pct = ((current_sales / prev_sales) - 1) * 100
-                t_nagar_growth.append({
-                    'Year Comparison': f"{prev_year} to {current_year}",
-                    'Growth (%)': f"{growth_pct:.2f}%"
-                })
+            # Calculate growth percentages against the previous year
+            year_labels = t_nagar_yearly['Year'].astype(str)
+            growth_pct = t_nagar_yearly['MTD SALES'].pct_change(
+                fill_method=None) * 100
+            t_nagar_growth = pd.DataFrame({
+                'Year Comparison': (year_labels.shift() + ' to ' + year_labels).iloc[1:].to_numpy(),
+                'Growth (%)': format_percent_array(growth_pct.iloc[1:].to_numpy())
+            })
 
             # Display growth table
-            st.dataframe(pd.DataFrame(t_nagar_growth),
-                         use_container_width=True)
+            st.dataframe(t_nagar_growth, use_container_width=True)
 
             # If we have 2023 and 2025, calculate total growth
             if '2023' in t_nagar_years and '2025' in t_nagar_years:
@@ -1287,112 +1522,91 @@ with tab5:
         "combined": "dataset/MTD - MTD 2022-2023-2024-2025.csv"
     }
 
-    # Create a function to load MTD data
-    def load_mtd_data(file_path):
+    # Create a function to load MTD data, cached until the file changes
+    @st.cache_data
+    def load_mtd_data(file_path, mtime):
         try:
+            # Reuse the cleaned Parquet copy if the CSV hasn't changed
+            df = read_local_parquet(file_path, '.mtd.parquet')
+            if df is not None:
+                return df
+
             # Different loading logic based on file type
             if "2022-2023-2024-2025" in file_path:
                 # Combined file has a different structure
-                df = pd.read_csv(file_path, skiprows=1)
-                df.columns = df.columns.str.strip()
-                return df
+                df = read_local_csv(file_path, skip_rows=1)
             else:
                 # Single year files
-                df = pd.read_csv(file_path, skiprows=0)
-                # Clean column names
-                df.columns = [col.strip() for col in df.columns]
+                df = read_local_csv(file_path)
                 # Remove empty rows and summary rows
                 df = df[df['S.NO'].notna() & df['SALONS'].notna()]
                 # Convert S.NO to numeric
                 df['S.NO'] = pd.to_numeric(df['S.NO'], errors='coerce')
-                return df
+
+            write_local_parquet(df, file_path, '.mtd.parquet')
+            return df
         except Exception as e:
             st.error(f"Error loading {file_path}: {e}")
             return pd.DataFrame()
 
     # Load combined MTD data
     if os.path.exists(mtd_files["combined"]):
-        combined_mtd = load_mtd_data(mtd_files["combined"])
+        combined_mtd = load_mtd_data(
+            mtd_files["combined"], os.path.getmtime(mtd_files["combined"]))
 
         # Show the monthly trend for all years
         st.subheader("Monthly Sales Trend (2022-2025)")
 
-        # Reshape data for plotting
         if not combined_mtd.empty:
-            # Melt the dataframe for easier plotting
-            melted_data = pd.melt(
-                combined_mtd,
-                id_vars=['Month'],
-                value_vars=['2022', '2023', '2024', '2025'],
-                var_name='Year',
-                value_name='Sales'
-            )
-
-            # Convert to numeric
-            melted_data['Sales'] = pd.to_numeric(
-                melted_data['Sales'], errors='coerce')
-
-            # Add formatted sales for hover display
-            melted_data['formatted_sales'] = melted_data['Sales'].apply(
-                lambda x: format_indian_money(x).replace(
-                    '₹', '') if pd.notna(x) else ''
-            )
-
-            # Create line chart
-            fig = px.line(
-                melted_data,
-                x='Month',
-                y='Sales',
-                color='Year',
-                markers=True,
+            # Month-by-year sales matrix shared by the chart, the growth
+            # labels and the yearly totals
+            sales_by_month = combined_mtd.set_index('Month')[
+                ['2022', '2023', '2024', '2025']].apply(pd.to_numeric, errors='coerce')
+
+            # Create line chart with one trace per year
+            fig = go.Figure()
+            months = sales_by_month.index.to_numpy()
+            for year in sales_by_month.columns:
+                fig.add_trace(go.Scatter(
+                    x=months,
+                    y=sales_by_month[year].to_numpy(),
+                    mode='lines+markers',
+                    name=year,
+                    hovertemplate='₹%{y:,.0f}<extra></extra>'
+                ))
+            fig.update_layout(
                 title="Monthly Sales Comparison Across Years",
-                labels={'Sales': 'Sales', 'Month': 'Month'}
-            )
-
-            # Update traces to use formatted text
-            fig.update_traces(
-                text=melted_data['formatted_sales'],
-                hovertemplate='₹%{text}<extra></extra>'
+                xaxis_title='Month',
+                yaxis_title='Sales',
+                legend_title='Year'
             )
 
-            # Add percentage labels for year-over-year growth
-            for year in ['2023', '2024', '2025']:
-                if year in melted_data['Year'].unique():
-                    # Get previous year
-                    prev_year = str(int(year) - 1)
-
-                    if prev_year in melted_data['Year'].unique():
-                        # Calculate growth for each month
-                        for month in combined_mtd['Month'].unique():
-                            current = melted_data[(melted_data['Year'] == year) & (
-                                melted_data['Month'] == month)]['Sales'].values
-                            previous = melted_data[(melted_data['Year'] == prev_year) & (
-                                melted_data['Month'] == month)]['Sales'].values
-
-                            if len(current) > 0 and len(previous) > 0 and previous[0] > 0:
-                                growth = ((current[0] / previous[0]) - 1) * 100
-
-                                # Add annotation
-                                fig.add_annotation(
-                                    x=month,
-                                    y=current[0],
-                                    text=f"{growth:.1f}%",
-                                    showarrow=True,
-                                    arrowhead=1,
-                                    xshift=5,
-                                    yshift=10
-                                )
+            # Add percentage labels for year-over-year growth, computed for
+            # every month and year pair at once
+            previous_sales = sales_by_month.shift(axis=1)
+            growth_matrix = (
+                (sales_by_month / previous_sales.where(previous_sales > 0)) - 1) * 100
+
+            growth_values = growth_matrix.to_numpy()
+            sales_values = sales_by_month.to_numpy()
+            for row, col in zip(*np.nonzero(np.isfinite(growth_values))):
+                fig.add_annotation(
+                    x=months[row],
+                    y=sales_values[row, col],
+                    text=f"{growth_values[row, col]:.1f}%",
+                    showarrow=True,
+                    arrowhead=1,
+                    xshift=5,
+                    yshift=10
+                )
 
             st.plotly_chart(fig, use_container_width=True)
 
             # Show the total for each year
             st.subheader("Yearly Totals")
 
-            # Calculate yearly totals
-            yearly_totals = {}
-            for year in ['2022', '2023', '2024', '2025']:
-                if year in combined_mtd.columns:
-                    yearly_totals[year] = combined_mtd[year].sum()
+            # Calculate yearly totals from the month-by-year matrix above
+            yearly_totals = sales_by_month.sum().to_dict()
 
             # Calculate year-over-year growth
             yearly_growth = []
@@ -1443,23 +1657,26 @@ with tab5:
 
                 # Show growth data table
                 formatted_growth = growth_df.copy()
-                formatted_growth['Sales'] = formatted_growth['Sales'].apply(
-                    lambda x: format_indian_money(x))
-                formatted_growth['Previous Sales'] = formatted_growth['Previous Sales'].apply(
-                    lambda x: format_indian_money(x))
-                formatted_growth['Growth (%)'] = formatted_growth['Growth (%)'].apply(
-                    lambda x: f"{x:.2f}%")
+                money_cols = ['Sales', 'Previous Sales']
+                formatted_growth[money_cols] = format_indian_money_array(
+                    growth_df[money_cols].to_numpy(dtype=float))
+                formatted_growth['Growth (%)'] = format_percent_array(
+                    growth_df['Growth (%)'].to_numpy())
 
                 st.dataframe(formatted_growth, use_container_width=True)
 
-    # Function to load MTD data specifically for salon analysis
-    def load_mtd_salon_data(file_path, target_year):
+    # Function to load MTD data specifically for salon analysis, cached until
+    # the file changes
+    @st.cache_data(show_spinner=False)
+    def load_mtd_salon_data(file_path, target_year, mtime):
         try:
-            # Read the CSV file
-            df = pd.read_csv(file_path)
+            # Reuse the cleaned Parquet copy if the CSV hasn't changed
+            salon_data = read_local_parquet(file_path, '.salons.parquet')
+            if salon_data is not None:
+                return salon_data
 
-            # Clean up column names
-            df.columns = [str(col).strip() for col in df.columns]
+            # Read the CSV file
+            df = read_local_csv(file_path)
 
             # Handle the empty first column if it exists
             if df.columns[0] == '' or df.columns[0] == 'Unnamed: 0':
@@ -1483,12 +1700,13 @@ with tab5:
 
             # Filter out rows where SALONS is missing or empty or contains summary data
             if 'SALONS' in df.columns:
-                # Drop rows with NaN in SALONS
-                df = df.dropna(subset=['SALONS'])
-
-                # Drop rows where SALONS is empty or numeric (likely a total)
-                df = df[df['SALONS'].astype(str).str.strip() != '']
-                df = df[~df['SALONS'].astype(str).str.match(r'^\d+$')]
+                # Drop rows where SALONS is missing, empty, numeric or
+                # mentions "total" (case insensitive), all in one mask
+                salon_names = df['SALONS'].astype(str).str.strip()
+                df = df[df['SALONS'].notna()
+                        & (salon_names != '')
+                        & ~salon_names.str.isdigit()
+                        & ~salon_names.str.lower().str.contains('total', regex=False)]
 
                 # If S.NO exists, filter to only keep rows with valid S.NO
                 if 'S.NO' in df.columns:
@@ -1505,26 +1723,52 @@ with tab5:
             # Clean the data - select only SALONS and month columns
             salon_data = df[['SALONS'] + month_columns].copy()
 
-            # Convert month columns to numeric, handling commas and currency symbols
-            for month in month_columns:
-                if salon_data[month].dtype == 'object':
-                    salon_data[month] = salon_data[month].astype(
-                        str).str.replace(',', '')
-                    salon_data[month] = salon_data[month].astype(
-                        str).str.replace('₹', '')
-                    salon_data[month] = salon_data[month].astype(
-                        str).str.replace(' ', '')
-                salon_data[month] = pd.to_numeric(
-                    salon_data[month], errors='coerce')
-
-            # Remove any rows where SALONS contains "total" (case insensitive)
-            salon_data = salon_data[~salon_data['SALONS'].astype(
-                str).str.lower().str.contains('total')]
-
+            # Convert month columns to numeric, stripping commas, currency
+            # symbols and spaces in one regex pass per text column
+            text_months = [month for month in month_columns
+                           if salon_data[month].dtype == 'object']
+            if text_months:
+                salon_data[text_months] = salon_data[text_months].apply(
+                    lambda col: col.str.replace(r'[,₹\s]', '', regex=True))
+            salon_data[month_columns] = salon_data[month_columns].apply(
+                pd.to_numeric, errors='coerce').astype('float32')
+
+            write_local_parquet(salon_data, file_path, '.salons.parquet')
             return salon_data
         except Exception as e:
             return pd.DataFrame()
 
+    # One month's sales per salon across years, cached per year selection
+    @st.cache_data(show_spinner=False)
+    def merge_salon_month(year_files, month):
+        """
+        Align one month's salon sales from each (year, path, mtime) entry on
+        the salon names, with missing sales as 0
+        """
+        all_salon_data = {}
+
+        for year, file_path, mtime in year_files:
+            salon_data = load_mtd_salon_data(file_path, year, mtime)
+
+            if not salon_data.empty and month in salon_data.columns:
+                # Keep the month's sales indexed by salon and named after
+                # the year, using the first row of any repeated salon
+                all_salon_data[year] = salon_data.drop_duplicates('SALONS').set_index(
+                    'SALONS')[month].rename(year)
+
+        if not all_salon_data:
+            return pd.DataFrame()
+
+        # Align all years on the salon names in one outer join
+        loaded_years = list(all_salon_data)
+        merged_data = pd.concat(
+            all_salon_data.values(), axis=1).rename_axis('SALONS').reset_index()
+
+        # Fill NaN values with 0, keeping the sales as float32
+        merged_data[loaded_years] = merged_data[loaded_years].apply(
+            pd.to_numeric, errors='coerce').fillna(0).astype('float32')
+        return merged_data
+
     # Load salon data directly from MTD files for comparison
     st.subheader("Salon Performance Analysis")
 
@@ -1560,56 +1804,37 @@ with tab5:
         if selected_years and selected_month:
             st.write(f"### {selected_month} Salon Performance")
 
-            # Load all selected years' data
-            all_salon_data = {}
-
-            for year in selected_years:
-                file_path = available_files[year]
-                salon_data = load_mtd_salon_data(file_path, year)
-
-                if not salon_data.empty and selected_month in salon_data.columns:
-                    # Prepare the data
-                    data = salon_data[['SALONS', selected_month]].copy()
-                    # Rename month column to year
-                    data.columns = ['SALONS', year]
-                    # Store in dictionary
-                    all_salon_data[year] = data
-
-            # If we have data from multiple years, merge and create visualizations
-            if len(all_salon_data) > 0:
-                # Merge data from all years
-                merged_data = None
-
-                for year, data in all_salon_data.items():
-                    if merged_data is None:
-                        merged_data = data
-                    else:
-                        merged_data = pd.merge(
-                            merged_data, data, on='SALONS', how='outer')
-
-                # Fill NaN values with 0
-                for year in selected_years:
-                    if year in merged_data.columns:
-                        merged_data[year] = pd.to_numeric(
-                            merged_data[year], errors='coerce').fillna(0)
-
-                # Sort by the latest year's data
-                if selected_years:
-                    latest_year = max(selected_years)
-                    if latest_year in merged_data.columns:
-                        merged_data = merged_data.sort_values(
-                            by=latest_year, ascending=False)
-
-                # Top salons visualization
-                top_salons = merged_data.head(15)
+            # Load and align all selected years' data
+            merged_data = merge_salon_month(
+                tuple((year, available_files[year], os.path.getmtime(available_files[year]))
+                      for year in selected_years),
+                selected_month)
+
+            # If we have data from any year, create visualizations
+            if not merged_data.empty:
+                loaded_years = [
+                    col for col in merged_data.columns if col != 'SALONS']
+
+                # Each year's sales as an array, shared by the chart, the
+                # table and the totals below
+                year_sales = {year: merged_data[year].to_numpy()
+                              for year in loaded_years}
+
+                # Top salons visualization, ranked by the latest year's data
+                # without sorting the whole table
+                latest_year = max(selected_years)
+                if latest_year in year_sales:
+                    top_salons = merged_data.nlargest(15, latest_year)
+                else:
+                    top_salons = merged_data.head(15)
+                top_positions = merged_data.index.get_indexer(top_salons.index)
+                top_year_sales = {year: sales[top_positions]
+                                  for year, sales in year_sales.items()}
 
                 # Add formatted sales for hover display
-                for year in selected_years:
-                    if year in top_salons.columns:
-                        top_salons[f'formatted_{year}'] = top_salons[year].apply(
-                            lambda x: format_indian_money(x).replace(
-                                '₹', '') if pd.notna(x) and x > 0 else ''
-                        )
+                top_salons[[f'formatted_{year}' for year in loaded_years]] = \
+                    format_positive_money_array(np.column_stack(
+                        [top_year_sales[year] for year in loaded_years]), symbol="")
 
                 # Create the chart
                 fig = px.bar(
@@ -1629,31 +1854,34 @@ with tab5:
                         fig.data[i].texttemplate = '₹%{text}'
                         fig.data[i].hovertemplate = '₹%{text}<extra></extra>'
 
-                # Add growth percentages for multiple years
+                # Add growth percentages for multiple years as one text trace
                 if len(selected_years) > 1:
+                    salon_names = top_salons['SALONS'].to_numpy()
+                    label_x, label_y, label_text = [], [], []
                     for i in range(1, len(selected_years)):
                         current_year = selected_years[i]
                         prev_year = selected_years[i-1]
 
-                        for j, salon in enumerate(top_salons['SALONS']):
-                            salon_row = top_salons[top_salons['SALONS']
-                                                   == salon].iloc[0]
-
-                            prev_val = salon_row[prev_year]
-                            curr_val = salon_row[current_year]
-
-                            if prev_val > 0:
-                                growth = ((curr_val / prev_val) - 1) * 100
-                                # Add annotation for significant growth
-                                if abs(growth) > 10:
-                                    fig.add_annotation(
-                                        x=salon,
-                                        y=curr_val,
-                                        text=f"{growth:.1f}%",
-                                        showarrow=True,
-                                        arrowhead=1,
-                                        yshift=10
-                                    )
+                        curr_sales = top_year_sales[current_year]
+                        growth = growth_percent(
+                            curr_sales, top_year_sales[prev_year])
+
+                        # Label only significant growth
+                        significant = np.abs(growth) > 10
+                        label_x.append(salon_names[significant])
+                        label_y.append(curr_sales[significant])
+                        label_text.append(np.char.add(
+                            np.char.mod('%.1f', growth[significant]), '%'))
+
+                    fig.add_trace(go.Scatter(
+                        x=np.concatenate(label_x),
+                        y=np.concatenate(label_y),
+                        text=np.concatenate(label_text),
+                        mode='text',
+                        textposition='top center',
+                        showlegend=False,
+                        hoverinfo='skip'
+                    ))
 
                 st.plotly_chart(fig, use_container_width=True)
 
@@ -1664,10 +1892,8 @@ with tab5:
                 display_data = merged_data.copy()
 
                 # Format monetary values
-                for year in selected_years:
-                    if year in display_data.columns:
-                        display_data[year] = display_data[year].apply(
-                            lambda x: format_indian_money(x) if x > 0 else "")
+                display_data[loaded_years] = format_positive_money_array(
+                    np.column_stack([year_sales[year] for year in loaded_years]))
 
                 # Add growth columns
                 if len(selected_years) > 1:
@@ -1678,17 +1904,18 @@ with tab5:
                         growth_col = f"Growth {prev_year}-{current_year}"
 
                         # Calculate growth
-                        merged_data[growth_col] = merged_data.apply(
-                            lambda row: (
-                                (row[current_year] / row[prev_year]) - 1) * 100
-                            if row[prev_year] > 0 else 0,
-                            axis=1
-                        )
+                        growth = growth_percent(
+                            year_sales[current_year], year_sales[prev_year])
 
-                        # Format growth column
-                        display_data[growth_col] = merged_data[growth_col].apply(
-                            lambda x: f"{x:.2f}%" if x != 0 else ""
-                        )
+                        # Format growth column, leaving no-growth cells blank
+                        display_data[growth_col] = np.where(
+                            growth != 0, format_percent_array(growth), "")
+
+                # Rank the table by the latest year's sales, sorting only
+                # here where the whole table is shown
+                if latest_year in loaded_years:
+                    display_data = display_data.loc[merged_data[latest_year].sort_values(
+                        ascending=False).index]
 
                 # Display the table
                 st.dataframe(display_data, use_container_width=True)
@@ -1696,11 +1923,10 @@ with tab5:
                 # Summary statistics
                 st.subheader("Summary Statistics")
 
-                # Calculate total sales per year
-                totals = {}
-                for year in selected_years:
-                    if year in merged_data.columns:
-                        totals[year] = merged_data[year].sum()
+                # Calculate total sales per year, adding the float32 sales
+                # up in float64
+                totals = {year: sales.sum(dtype=np.float64)
+                          for year, sales in year_sales.items()}
 
                 # Calculate year-over-year growth
                 growth_stats = []
@@ -1752,12 +1978,12 @@ def read_salon_file(file_path):
         # Try multiple approaches to read the file
 
         # Approach 1: Standard read
-        df = pd.read_csv(file_path)
+        df = pd.read_csv(file_path, engine='pyarrow')
         if df.shape[1] >= 10 and 'SALONS' in df.columns:
             return df
 
         # Approach 2: Skip first row
-        df = pd.read_csv(file_path, skiprows=1)
+        df = pd.read_csv(file_path, skiprows=1, engine='pyarrow')
         if df.shape[1] >= 10:
             # Identify the salon column
             salon_col = None
@@ -1775,7 +2001,7 @@ def read_salon_file(file_path):
                 return df
 
         # Approach 3: Try with no header and assign column names
-        df = pd.read_csv(file_path, header=None)
+        df = pd.read_csv(file_path, header=None, engine='pyarrow')
 
         # Typical structure of MTD files
         # Typical number of columns (S.NO, SALONS, 12 months)
@@ -1815,148 +2041,11 @@ def read_salon_file(file_path):
 # Add footer
 st.markdown("---")
 st.caption("Executive Dashboard - Created with Streamlit and Plotly")
+
 with tab6:
-    important_dates = {
-    "New Year": "2024-01-01",
-    "Pongal": "2024-01-14",
-    "Republic Day": "2024-01-26",
-    "Good Friday": "2024-03-29",
-    "Eid al-Fitr": "2024-04-10",
-    "Tamil New Year": "2024-04-14",
-    "Eid al-Adha": "2024-06-16",
-    "Independence Day": "2024-08-15",
-    "Diwali": "2024-11-01",
-    "Christmas": "2024-12-25",
-    "Exam Start": "2024-03-01",
-    "Exam End": "2024-04-15",
-    "Wedding Peak 1": "2024-02-15",
-    "Wedding Peak 2": "2024-11-25"
-}
-
-# Streamlit page configuration
-st.set_page_config(page_title="Service and Leave Data Analysis", layout="wide")
-st.title("Service Sales and Leave Data Analysis for 2024 Events")
-
-# Sidebar file upload for both datasets
-st.sidebar.header("Upload Your Datasets")
-sales_file = st.sidebar.file_uploader("Upload Service Sales CSV", type=["csv"])
-leaves_file = st.sidebar.file_uploader("Upload Leaves Data CSV", type=["csv"])
-
-# Helper function to load data
-@st.cache_data
-def load_data(file, date_column=None, numeric_columns=None):
-    try:
-        data = pd.read_csv(file, low_memory=False)
-        # Convert date column to datetime
-        if date_column:
-            data[date_column] = pd.to_datetime(data[date_column], errors='coerce', dayfirst=True)
-        # Convert specified numeric columns to numeric
-        if numeric_columns:
-            for col in numeric_columns:
-                data[col] = pd.to_numeric(data[col], errors='coerce')
-        # Drop rows with invalid date or numeric values
-        if date_column:
-            data = data.dropna(subset=[date_column])
-        if numeric_columns:
-            data = data.dropna(subset=numeric_columns)
-        return data
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        return None
-
-# Load sales and leaves datasets
-sales_data = load_data(sales_file, date_column="Sale Date", numeric_columns=["Sales Collected (Exc.Tax)"]) if sales_file else None
-leaves_data = load_data(leaves_file, date_column="Date", numeric_columns=["MTD Sale"]) if leaves_file else None
-
-# Check if data is loaded
-if sales_data is None or sales_data.empty:
-    st.warning("Please upload a valid Service Sales dataset.")
-else:
-    st.write("Sales Data Preview:")
-    st.dataframe(sales_data)
-
-if leaves_data is None or leaves_data.empty:
-    st.warning("Please upload a valid Leaves dataset.")
-else:
-    st.write("Leaves Data Preview:")
-    st.dataframe(leaves_data)
-
-# Proceed only if both datasets are loaded
-if sales_data is not None and not sales_data.empty and leaves_data is not None and not leaves_data.empty:
-    # Filter sales data for 2024
-    sales_data['Year'] = sales_data['Sale Date'].dt.year
-    filtered_sales = sales_data[sales_data['Year'] == 2024]
-
-    # Dropdown for event selection from sales and leaves datasets
-    st.subheader("Event Selection")
-    selected_event = st.selectbox("Choose an event:", list(important_dates.keys()))
-    event_date = pd.to_datetime(important_dates[selected_event])
-
-    # Filter sales data for the selected event (±7 days)
-    event_sales = filtered_sales[
-        (filtered_sales['Sale Date'] >= event_date - pd.Timedelta(days=7)) &
-        (filtered_sales['Sale Date'] <= event_date + pd.Timedelta(days=7))
-    ]
-
-    # Dropdown for center selection in sales data
-    selected_center = st.selectbox("Choose a Center:", 
-                                   filtered_sales['Center Name'].unique() if 'Center Name' in filtered_sales.columns else ["All Centers"])
-
-    if selected_center != "All Centers":
-        event_sales = event_sales[event_sales['Center Name'] == selected_center]
-
-    # Filter leaves data for the selected event
-    event_leaves = leaves_data[
-        (leaves_data['Date'] >= event_date - pd.Timedelta(days=7)) &
-        (leaves_data['Date'] <= event_date + pd.Timedelta(days=7))
-    ]
-
-    # Display filtered data
-    if not event_sales.empty or not event_leaves.empty:
-        st.subheader(f"Filtered Data for {selected_event} (±7 Days from {event_date.strftime('%Y-%m-%d')})")
-
-        if not event_sales.empty:
-            st.write("Sales Data:")
-            st.dataframe(event_sales)
-
-            # Plot MTD Sales Histogram for Sales Data
-            sales_mtd = event_sales.groupby('Sale Date', as_index=False)['Sales Collected (Exc.Tax)'].sum()
-            fig_sales = px.bar(
-                sales_mtd, x='Sale Date', y='Sales Collected (Exc.Tax)',
-                color='Sales Collected (Exc.Tax)', color_continuous_scale="blues",
-                title=f"Sales MTD Histogram Around {selected_event}"
-            )
-            fig_sales.update_layout(
-                xaxis_title="Date", yaxis_title="MTD Sales (Exc. Tax)", bargap=0.2
-            )
-            st.plotly_chart(fig_sales)
+    st.header("Service Sales and Leave Data Analysis for 2024 Events")
 
-            # Total Sales Analysis
-            total_sales = event_sales['Sales Collected (Exc.Tax)'].sum()
-            st.subheader("Total Sales Analysis")
-            st.write(f"Total Sales for {selected_center} during {selected_event}: {total_sales:.2f}")
-        else:
-            st.warning(f"No sales data found for {selected_event} (±7 days).")
-
-        if not event_leaves.empty:
-            st.write("Leaves Data:")
-            st.dataframe(event_leaves)
-
-            # Plot MTD Sales Histogram for Leaves Data
-            leaves_mtd = event_leaves.groupby('Date', as_index=False)['MTD Sale'].sum()
-            fig_leaves = px.bar(
-                leaves_mtd, x='Date', y='MTD Sale',
-                color='MTD Sale', color_continuous_scale="greens",
-                title=f"Leave MTD Histogram Around {selected_event}"
-            )
-            fig_leaves.update_layout(
-                xaxis_title="Date", yaxis_title="MTD Sales (Leave Data)", bargap=0.2
-            )
-            st.plotly_chart(fig_leaves)
+    # File upload for both datasets
+    event_sales_file, event_leaves_file = upload_event_files(st)
 
-            # Total Leave Sales Analysis
-            total_leaves_sales = event_leaves['MTD Sale'].sum()
-            st.subheader("Total Leave Sales Analysis")
-            st.write(f"Total Leave Sales during {selected_event}: {total_leaves_sales:.2f}")
-        else:
-            st.warning(f"No leave data found for {selected_event} (±7 days).")
+    render_uploaded_event_analysis(event_sales_file, event_leaves_file)